@@ -0,0 +1,36 @@
+"""Random walks of drunks on fields: one core behind walks.py, walk2.py and random_walk.py.
+
+Importing the package loads only the standard-library core (Location,
+Field, OddField, the Drunk classes and the step-by-step walk drivers).
+The NumPy engine, statistics, analytic formulas and matplotlib plots
+live in submodules that are imported on first use, either directly or
+through attribute access such as drunkwalk.final_positions, so an
+import stays inside IMPORT_BUDGET_MS (check with python -m drunkwalk).
+"""
+import importlib
+
+from .core import (ColdDrunk, Drunk, EWDrunk, Field, Location, MasochistDrunk, OddField,
+                   StyleIterator, TrajectorySampler, UsualDrunk, final_locs, iter_walks,
+                   sim_walks, trace, walk)
+
+IMPORT_BUDGET_MS = 20
+
+# Names served lazily from the submodules that need NumPy or matplotlib
+LAZY_NAMES = {
+    'AliasSampler': 'engine', 'BatchOddField': 'engine', 'batch_final_locs': 'engine',
+    'fast_final_locs': 'engine', 'final_positions': 'engine', 'run_shard': 'engine', 'run_sharded': 'engine',
+    'sim_walks_vectorized': 'engine', 'step_distribution': 'engine', 'step_table': 'engine',
+    'vectorizable': 'engine', 'walk_trajectories': 'engine',
+    'RunningStats': 'stats',
+    'CrowdField': 'crowd', 'CrowdOddField': 'crowd',
+    'distance_variance': 'analytic', 'drift': 'analytic', 'expected_distance': 'analytic',
+    'expected_position': 'analytic', 'mean_square_distance': 'analytic',
+}
+SUBMODULES = ('analytic', 'crowd', 'engine', 'plots', 'stats')
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in LAZY_NAMES:
+        return getattr(importlib.import_module(f'.{LAZY_NAMES[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,69 @@
+"""python -m drunkwalk: check every Field subclass against the walk drivers, then
+time a cold import of the package against IMPORT_BUDGET_MS."""
+import random
+import subprocess
+import sys
+
+from . import IMPORT_BUDGET_MS, crowd
+from .core import Field, Location, UsualDrunk, final_locs, sim_walks, trace, walk
+
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+import drunkwalk
+elapsed = (time.perf_counter() - start) * 1000
+heavy = sorted(m for m in ('numpy', 'matplotlib') if m in sys.modules)
+print(elapsed, ','.join(heavy))
+'''
+
+def measure(runs: int = 5):
+    """Best of runs cold imports in fresh interpreters: (milliseconds, heavy modules loaded)."""
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', PROBE], capture_output=True,
+                             text=True, check=True).stdout.split()
+        results.append((float(out[0]), out[1] if len(out) > 1 else ''))
+    return min(results)
+
+def field_classes(base=Field):
+    """base and all its subclasses, depth first."""
+    classes = [base]
+    for sub in base.__subclasses__():
+        classes.extend(field_classes(sub))
+    return classes
+
+def check_fields() -> list:
+    """Run walk, trace, sim_walks and final_locs on every Field subclass, in both
+    modes; return (field class name, driver, error) for each failure."""
+    failures = []
+    for field_class in field_classes():
+        for in_place in (False, True):
+            def run_walk():
+                f = field_class(in_place=in_place)
+                d = UsualDrunk()
+                f.add_drunk(d, Location(0, 0))
+                walk(f, d, 20)
+                trace(f, d, 20)
+            drivers = {
+                'walk/trace': run_walk,
+                'sim_walks': lambda: sim_walks(20, 3, UsualDrunk, field_class, in_place),
+                'final_locs': lambda: final_locs(20, 3, UsualDrunk, field_class, in_place),
+            }
+            for name, driver in drivers.items():
+                try:
+                    driver()
+                except Exception as e:
+                    failures.append((field_class.__name__, name, repr(e)))
+    return failures
+
+if __name__ == '__main__':
+    random.seed(0)
+    failures = check_fields()
+    print(f'{len(field_classes())} Field classes checked, {len(failures)} failures')
+    for failure in failures:
+        print(' ', *failure)
+    elapsed, heavy = measure()
+    print(f'import drunkwalk: {elapsed:.2f} ms (budget {IMPORT_BUDGET_MS} ms)')
+    if heavy:
+        print('eagerly imported:', heavy)
+    sys.exit(0 if elapsed <= IMPORT_BUDGET_MS and not heavy and not failures else 1)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from .engine import step_distribution
+
+# Gauss-Hermite nodes for E|X| under the normal approximation of a walk
+HERMITE_NODES, HERMITE_WEIGHTS = np.polynomial.hermite.hermgauss(60)
+
+def step_moments(d_class):
+    """(mean, covariance) of one step of d_class as numpy arrays."""
+    steps, probabilities = step_distribution(d_class)
+    mean = probabilities @ steps
+    centred = steps - mean
+    covariance = (centred * probabilities[:, None]).T @ centred
+    return mean, covariance
+
+def drift(d_class) -> np.ndarray:
+    """Expected (dx, dy) per step, e.g. (0, 0.05) for MasochistDrunk."""
+    return step_moments(d_class)[0]
+
+def expected_position(d_class, num_steps):
+    """Exact mean position after num_steps: num_steps * drift."""
+    return np.multiply.outer(num_steps, drift(d_class))
+
+def mean_square_distance(d_class, num_steps):
+    """Exact E[distance**2] after num_steps: n * trace(cov) + (n * |drift|)**2."""
+    mean, covariance = step_moments(d_class)
+    n = np.asarray(num_steps, dtype=float)
+    return n * np.trace(covariance) + (n * np.hypot(*mean)) ** 2
+
+def expected_distance(d_class, num_steps):
+    """E[distance from origin] after num_steps (scalar or array of lengths).
+
+    The end point is approximated as normal with mean n * drift and
+    covariance n * cov (central limit theorem), and E|X| is integrated
+    by 2-D Gauss-Hermite quadrature. Without drift and with isotropic
+    steps this is the Rayleigh mean sqrt(pi * n * trace(cov)) / 2, about
+    0.886 * sqrt(n) for the usual drunk; with drift it tends to
+    n * |drift|. Accurate to within a few percent from ~10 steps on.
+    """
+    mean, covariance = step_moments(d_class)
+    # covariance may be singular (e.g. EW_drunk), so take its root by eigendecomposition
+    values, vectors = np.linalg.eigh(covariance)
+    root = vectors * np.sqrt(np.clip(values, 0, None))
+    u, v = np.meshgrid(HERMITE_NODES, HERMITE_NODES, indexing='ij')
+    weights = np.outer(HERMITE_WEIGHTS, HERMITE_WEIGHTS) / np.pi
+    noise = np.sqrt(2) * (root @ np.stack([u.ravel(), v.ravel()]))
+
+    n = np.asarray(num_steps, dtype=float)
+    flat = n.reshape(-1, 1, 1)
+    points = flat * mean[:, None] + np.sqrt(flat) * noise
+    result = (np.hypot(points[:, 0], points[:, 1]) * weights.ravel()).sum(axis=1)
+    return result.reshape(n.shape) if n.ndim else float(result[0])
+
+def distance_variance(d_class, num_steps):
+    """Var[distance from origin] after num_steps, from the two moments above."""
+    return np.clip(mean_square_distance(d_class, num_steps)
+                   - np.square(expected_distance(d_class, num_steps)), 0, None)
@@ -0,0 +1,84 @@
+"""Scalar-path micro-benchmark: python -m drunkwalk.bench [NUM_STEPS]
+
+Steps one UsualDrunk through Field and OddField, allocating a new
+Location per step and in place, and reports steps/sec, Location
+allocations per step and bytes per Location. LegacyLocation is the
+dict-backed Location the walk scripts used before, kept as a baseline.
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from .core import Field, Location, OddField, UsualDrunk
+
+
+class LegacyLocation:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def move(self, delta_x, delta_y):
+        return LegacyLocation(self.x + delta_x, self.y + delta_y)
+
+
+CASES = (
+    ('Field, dict Location', Field, False, LegacyLocation),
+    ('Field, slotted Location', Field, False, Location),
+    ('Field, in place', Field, True, Location),
+    ('OddField, slotted Location', OddField, False, Location),
+    ('OddField, in place', OddField, True, Location),
+)
+
+def location_bytes(loc_class, n: int = 10000) -> float:
+    """Average bytes traced per instance of loc_class, __dict__ included."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    locs = [loc_class(float(i), float(i)) for i in range(n)]
+    size = (tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(locs)) / n
+    tracemalloc.stop()
+    return size
+
+def count_allocations(loc_class, step):
+    """How many loc_class objects step() creates."""
+    created = 0
+    original = loc_class.__init__
+    def counting_init(self, x, y):
+        nonlocal created
+        created += 1
+        original(self, x, y)
+    loc_class.__init__ = counting_init
+    try:
+        step()
+    finally:
+        loc_class.__init__ = original
+    return created
+
+def run_case(field_class, in_place, loc_class, num_steps, seed=0):
+    random.seed(seed)
+    f = field_class(in_place=in_place)
+    d = UsualDrunk()
+    f.add_drunk(d, loc_class(0, 0))
+    move = f.move_drunk
+    def step():
+        for _ in range(num_steps):
+            move(d)
+    start = time.perf_counter()
+    step()
+    elapsed = time.perf_counter() - start
+    return {
+        'steps_per_sec': num_steps / elapsed,
+        'allocations_per_step': count_allocations(loc_class, step) / num_steps,
+        'bytes_per_location': location_bytes(loc_class),
+    }
+
+def benchmark_fields(num_steps: int = 200000) -> dict:
+    return {label: run_case(field_class, in_place, loc_class, num_steps)
+            for label, field_class, in_place, loc_class in CASES}
+
+if __name__ == '__main__':
+    num_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{'case':<28}{'steps/sec':>12}{'allocs/step':>13}{'bytes/loc':>11}")
+    for label, r in benchmark_fields(num_steps).items():
+        print(f"{label:<28}{r['steps_per_sec']:>12,.0f}{r['allocations_per_step']:>13.3f}"
+              f"{r['bytes_per_location']:>11.0f}")
@@ -0,0 +1,239 @@
+import random
+
+
+class Location:
+    """An (x, y) point; slotted, so no per-instance __dict__.
+
+    move returns a new Location; shift updates this one, and is what
+    in-place Fields use to step without allocating.
+    """
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def move(self, delta_x, delta_y):
+        return Location(self.x + delta_x, self.y + delta_y)
+
+    def shift(self, delta_x, delta_y):
+        self.x += delta_x
+        self.y += delta_y
+
+    def get_x(self):
+        return self.x
+
+    def get_y(self):
+        return self.y
+
+    def dist_from(self, other: 'Location'):
+        x_dist, y_dist = self.x - other.x, self.y - other.y
+        return (x_dist**2 + y_dist**2) ** 0.5
+
+    def __str__(self):
+        return f'<{self.x}, {self.y}>'
+
+    # camelCase names used by walks.py and walk2.py
+    def getX(self):
+        return self.x
+
+    def getY(self):
+        return self.y
+
+    def distFrom(self, other):
+        return self.dist_from(other)
+
+
+class Field:
+    """Drunks and their locations.
+
+    By default every step replaces a drunk's Location with a new one.
+    With in_place=True the field owns one Location per drunk (a copy of
+    the one passed to add_drunk) and shifts it, so stepping allocates
+    nothing; get_loc then returns a snapshot rather than the live object.
+    """
+    def __init__(self, in_place=False):
+        self.drunks = {}
+        self.in_place = in_place
+
+    def add_drunk(self, drunk, loc):
+        if drunk in self.drunks:
+            raise ValueError("Duplicate drunk")
+        self.drunks[drunk] = Location(loc.x, loc.y) if self.in_place else loc
+
+    def move_drunk(self, drunk):
+        loc = self.drunks.get(drunk)
+        if loc is None:
+            raise ValueError("Drunk not in field")
+        x_dist, y_dist = drunk.take_step()
+        if self.in_place:
+            loc.shift(x_dist, y_dist)
+        else:
+            self.drunks[drunk] = loc.move(x_dist, y_dist)
+
+    def get_loc(self, drunk):
+        loc = self.drunks.get(drunk)
+        if loc is None:
+            raise ValueError("Drunk not in field")
+        return Location(loc.x, loc.y) if self.in_place else loc
+
+    def coords(self, drunk):
+        """The drunk's current (x, y), without copying its Location."""
+        loc = self.drunks.get(drunk)
+        if loc is None:
+            raise ValueError("Drunk not in field")
+        return loc.x, loc.y
+
+    def addDrunk(self, drunk, loc):
+        self.add_drunk(drunk, loc)
+
+    def moveDrunk(self, drunk):
+        self.move_drunk(drunk)
+
+    def getLoc(self, drunk):
+        return self.get_loc(drunk)
+
+
+class OddField(Field):
+    """A Field with num_holes wormholes: landing exactly on one jumps to its destination."""
+    def __init__(self, num_holes=1000, x_range=100, y_range=100, in_place=False):
+        super().__init__(in_place)
+        self.wormholes = {}
+        for _ in range(num_holes):
+            x, y = random.randint(-x_range, x_range), random.randint(-y_range, y_range)
+            new_x = random.randint(-x_range, x_range)
+            new_y = random.randint(-y_range, y_range)
+            self.wormholes[(x, y)] = Location(new_x, new_y)
+
+    def move_drunk(self, drunk):
+        super().move_drunk(drunk)
+        loc = self.drunks[drunk]
+        hole = self.wormholes.get((loc.x, loc.y))
+        if hole is None:
+            return
+        if self.in_place:
+            loc.x, loc.y = hole.x, hole.y
+        else:
+            self.drunks[drunk] = hole
+
+
+class Drunk:
+    # (dx, dy) steps the drunk picks from, and optional relative weights
+    # (equal if None). Drunks that override take_step (or takeStep) are
+    # simulated step by step.
+    step_choices = None
+    step_weights = None
+
+    def __init__(self, name=None):
+        self.name = name
+
+    def __str__(self):
+        return self.name if self.name is not None else 'Anonymous'
+
+    def take_step(self):
+        # Subclasses written against walks.py override takeStep only
+        if type(self).takeStep is not Drunk.takeStep:
+            return self.takeStep()
+        return self.table_step()
+
+    def takeStep(self):
+        if type(self).take_step is not Drunk.take_step:
+            return self.take_step()
+        return self.table_step()
+
+    def table_step(self):
+        """One step drawn from step_choices (weighted by step_weights)."""
+        if self.step_weights is None:
+            return random.choice(self.step_choices)
+        return random.choices(self.step_choices, self.step_weights)[0]
+
+
+class UsualDrunk(Drunk):
+    step_choices = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+class ColdDrunk(Drunk):
+    step_choices = ((0.0, 1.0), (0.0, -2.0), (-1, 0), (1, 0))
+
+class EWDrunk(Drunk):
+    step_choices = ((-1, 0), (1, 0))
+
+class MasochistDrunk(Drunk):
+    step_choices = ((0.0, 1.1), (0.0, -0.9), (1.0, 0.0), (-1.0, 0.0))
+
+
+class StyleIterator:
+    def __init__(self, styles):
+        self.index = 0
+        self.styles = styles
+
+    def next_style(self):
+        result = self.styles[self.index]
+        self.index = (self.index + 1) % len(self.styles)
+        return result
+
+    def nextStyle(self):
+        return self.next_style()
+
+
+def walk(f: Field, d: Drunk, num_steps: int):
+    """Move d num_steps times in f; return the distance from where it started."""
+    start = f.get_loc(d)
+    for _ in range(num_steps):
+        f.move_drunk(d)
+    return start.dist_from(f.get_loc(d))
+
+def iter_walks(num_steps: int, num_trials: int, d_class, field_class=Field, in_place=False):
+    """Yield the rounded final distance of each trial as it finishes."""
+    homer = d_class("Homer")
+    origin = Location(0, 0)
+    for _ in range(num_trials):
+        f = field_class(in_place=in_place)
+        f.add_drunk(homer, origin)
+        yield round(walk(f, homer, num_steps), 1)
+
+def sim_walks(num_steps: int, num_trials: int, d_class, field_class=Field, in_place=False):
+    return list(iter_walks(num_steps, num_trials, d_class, field_class, in_place))
+
+def final_locs(num_steps: int, num_trials: int, d_class, field_class=Field, in_place=False):
+    """Location of a fresh d_class after num_steps steps in a new field_class, per trial."""
+    locs = []
+    d = d_class()
+    for _ in range(num_trials):
+        f = field_class(in_place=in_place)
+        f.add_drunk(d, Location(0, 0))
+        for _ in range(num_steps):
+            f.move_drunk(d)
+        locs.append(f.get_loc(d))
+    return locs
+
+
+class TrajectorySampler:
+    """Keep at most max_points evenly spaced points of a walk of any length.
+
+    Every stride-th point is kept; when the buffer fills, every other
+    point is dropped and the stride doubles.
+    """
+    def __init__(self, max_points: int = 10000):
+        self.max_points = max_points
+        self.stride = 1
+        self.seen = 0
+        self.x_vals = []
+        self.y_vals = []
+
+    def add(self, x, y):
+        if self.seen % self.stride == 0:
+            self.x_vals.append(x)
+            self.y_vals.append(y)
+            if len(self.x_vals) >= self.max_points:
+                self.x_vals = self.x_vals[::2]
+                self.y_vals = self.y_vals[::2]
+                self.stride *= 2
+        self.seen += 1
+
+def trace(f: Field, d: Drunk, num_steps: int, max_points: int = 10000) -> TrajectorySampler:
+    """Move d (already in f) num_steps times, sampling the spots it visits."""
+    sampler = TrajectorySampler(max_points)
+    for _ in range(num_steps):
+        f.move_drunk(d)
+        sampler.add(*f.coords(d))
+    return sampler
@@ -0,0 +1,191 @@
+import numpy as np
+
+from .core import Field, Location
+from .engine import AliasSampler, BatchOddField, step_distribution, vectorizable
+
+
+class CrowdField(Field):
+    """A Field for crowds: every walker's position lives in shared x/y arrays.
+
+    add_drunk, move_drunk and get_loc (and their camelCase names) work
+    as in an in-place Field; move_drunk uses the drunk's own take_step.
+    tick moves every walker once: walkers are grouped by class, and each
+    group draws all its steps in one AliasSampler call from the field's
+    Generator. Classes that are not vectorizable fall back to take_step
+    per walker.
+
+    Positions are also bucketed into square grid cells of side
+    cell_size. The bucket index is a sorted array of cell keys, rebuilt
+    lazily on the first query after walkers move. occupancy,
+    occupants, neighbours and collisions answer from it with
+    searchsorted, without scanning every walker.
+
+    in_place is accepted so the field can stand in for Field in
+    field_class arguments; positions are always updated in place.
+    """
+    def __init__(self, cell_size: float = 1.0, seed=None, in_place=True):
+        self.cell_size = cell_size
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(16)
+        self.y = np.zeros(16)
+        self.count = 0
+        self.in_place = True
+        self.walkers = []
+        self.slots = {}  # drunk -> index into x, y
+        self.groups = None  # [(d_class, indices, table, sampler)], rebuilt after add_drunk
+        self.index = None  # (sorted cell keys, walker order), rebuilt after moves
+
+    def __len__(self):
+        return self.count
+
+    def add_drunk(self, drunk, loc):
+        if drunk in self.slots:
+            raise ValueError("Duplicate drunk")
+        if self.count == len(self.x):
+            self.x = np.resize(self.x, 2 * len(self.x))
+            self.y = np.resize(self.y, 2 * len(self.y))
+        self.x[self.count], self.y[self.count] = loc.x, loc.y
+        self.slots[drunk] = self.count
+        self.walkers.append(drunk)
+        self.count += 1
+        self.groups = self.index = None
+
+    def add_drunks(self, drunks, x, y):
+        """Add many drunks at once at coordinates x[i], y[i]."""
+        for drunk, xi, yi in zip(drunks, np.broadcast_to(x, len(drunks)),
+                                 np.broadcast_to(y, len(drunks))):
+            self.add_drunk(drunk, Location(float(xi), float(yi)))
+
+    def get_loc(self, drunk):
+        i = self.slot(drunk)
+        return Location(float(self.x[i]), float(self.y[i]))
+
+    def coords(self, drunk):
+        i = self.slot(drunk)
+        return float(self.x[i]), float(self.y[i])
+
+    def slot(self, drunk) -> int:
+        i = self.slots.get(drunk)
+        if i is None:
+            raise ValueError("Drunk not in field")
+        return i
+
+    def positions(self):
+        """(x, y) views of the live walkers' coordinates."""
+        return self.x[:self.count], self.y[:self.count]
+
+    def move_drunk(self, drunk):
+        i = self.slot(drunk)
+        x_dist, y_dist = drunk.take_step()
+        self.x[i] += x_dist
+        self.y[i] += y_dist
+        self.arrive(self.x[i:i + 1], self.y[i:i + 1])
+        self.index = None
+
+    def arrive(self, x, y):
+        """Hook run on walkers that just moved (x, y are views); CrowdOddField teleports here."""
+
+    def step_groups(self):
+        if self.groups is None:
+            by_class = {}
+            for i, drunk in enumerate(self.walkers):
+                by_class.setdefault(type(drunk), []).append(i)
+            self.groups = []
+            for d_class, indices in by_class.items():
+                if not vectorizable(d_class):
+                    self.groups.append((d_class, np.array(indices), None, None))
+                else:
+                    table, probabilities = step_distribution(d_class)
+                    self.groups.append((d_class, np.array(indices), table,
+                                        AliasSampler(probabilities)))
+        return self.groups
+
+    def tick(self, num_ticks: int = 1):
+        """Move every walker num_ticks times."""
+        x, y = self.positions()
+        for _ in range(num_ticks):
+            for _, indices, table, sampler in self.step_groups():
+                if table is None:
+                    steps = np.array([self.walkers[i].take_step() for i in indices], dtype=float)
+                else:
+                    steps = table[sampler.sample(self.rng, len(indices))]
+                x[indices] += steps[:, 0]
+                y[indices] += steps[:, 1]
+            self.arrive(x, y)
+        self.index = None
+
+    def cell_keys(self, x, y):
+        # one int64 per cell, ordered by column then row so a column's cells are contiguous
+        cx = np.floor_divide(x, self.cell_size).astype(np.int64)
+        cy = np.floor_divide(y, self.cell_size).astype(np.int64)
+        return (cx << 32) + (cy + (1 << 31))
+
+    def grid(self):
+        if self.index is None:
+            keys = self.cell_keys(*self.positions())
+            order = np.argsort(keys, kind='stable')
+            self.index = keys[order], order
+        return self.index
+
+    def occupancy(self) -> dict:
+        """{(cell_x, cell_y): walkers in that cell} for every occupied cell."""
+        keys, _ = self.grid()
+        cells, counts = np.unique(keys, return_counts=True)
+        return {(int(k >> 32), int((k & 0xffffffff) - (1 << 31))): int(n)
+                for k, n in zip(cells, counts)}
+
+    def occupants(self, x, y) -> list:
+        """Drunks in the grid cell containing (x, y)."""
+        keys, order = self.grid()
+        key = self.cell_keys(np.array([x]), np.array([y]))[0]
+        lo, hi = np.searchsorted(keys, [key, key + 1])
+        return [self.walkers[i] for i in sorted(order[lo:hi].tolist())]
+
+    def neighbour_indices(self, x, y, radius: float) -> np.ndarray:
+        """Indices of walkers within radius of (x, y), in the order they were added."""
+        keys, order = self.grid()
+        col_lo, col_hi = np.floor_divide([x - radius, x + radius], self.cell_size).astype(np.int64)
+        row_lo, row_hi = np.floor_divide([y - radius, y + radius], self.cell_size).astype(np.int64)
+        cols = np.arange(col_lo, col_hi + 1, dtype=np.int64) << 32
+        starts = np.searchsorted(keys, cols + (row_lo + (1 << 31)))
+        ends = np.searchsorted(keys, cols + (row_hi + (1 << 31)), side='right')
+        candidates = np.concatenate([order[s:e] for s, e in zip(starts, ends)] or [order[:0]])
+        px, py = self.positions()
+        near = np.hypot(px[candidates] - x, py[candidates] - y) <= radius
+        return np.sort(candidates[near])
+
+    def neighbours(self, x, y, radius: float) -> list:
+        """Drunks within radius of (x, y)."""
+        return [self.walkers[i] for i in self.neighbour_indices(x, y, radius).tolist()]
+
+    def collisions(self) -> list:
+        """Groups (lists of drunks) of two or more walkers on exactly the same spot."""
+        x, y = self.positions()
+        _, inverse, counts = np.unique(np.column_stack([x, y]), axis=0,
+                                       return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        shared = np.nonzero(counts[inverse] > 1)[0]
+        groups = {}
+        for i in shared.tolist():
+            groups.setdefault(int(inverse[i]), []).append(self.walkers[i])
+        return list(groups.values())
+
+
+class CrowdOddField(CrowdField):
+    """CrowdField with OddField's wormholes, applied to every walker that lands on one.
+
+    The holes are a single BatchOddField layout, so a tick does one
+    grid lookup for all walkers; wormholes gives them as an
+    {(x, y): (new_x, new_y)} dict.
+    """
+    def __init__(self, num_holes=1000, x_range=100, y_range=100, cell_size: float = 1.0,
+                 seed=None, in_place=True):
+        super().__init__(cell_size, seed)
+        self.holes = BatchOddField(num_holes, x_range, y_range, seed=self.rng)
+
+    @property
+    def wormholes(self) -> dict:
+        return self.holes.wormholes()
+
+    def arrive(self, x, y):
+        self.holes.teleport(x, y)
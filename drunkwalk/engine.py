@@ -0,0 +1,264 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .core import Drunk, Field, Location, OddField, final_locs, sim_walks
+
+
+class AliasSampler:
+    """Vose's alias method: O(k) setup, then O(1) per draw from a fixed distribution.
+
+    Each of the k columns holds its own outcome with probability prob[i]
+    and alias[i] otherwise, so a draw is one uniform column pick plus one
+    coin flip, done here for a whole array at a time.
+    """
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        k = len(weights)
+        scaled = weights * k / weights.sum()
+        self.prob = np.ones(k)
+        self.alias = np.arange(k)
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, rng, size):
+        columns = rng.integers(0, len(self.prob), size=size)
+        keep = rng.random(size) < self.prob[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+def vectorizable(d_class) -> bool:
+    """True if d_class steps by its step_choices table, so its steps can be drawn in bulk.
+
+    A class that overrides take_step or takeStep is not, even if it
+    inherits step_choices: only the per-step path runs its override.
+    """
+    return (d_class.step_choices is not None and d_class.take_step is Drunk.take_step
+            and d_class.takeStep is Drunk.takeStep)
+
+def step_distribution(d_class):
+    """(table, probabilities) for d_class: (k, 2) array of (dx, dy) and their odds."""
+    if not vectorizable(d_class):
+        raise ValueError(f"{d_class.__name__} has no step_choices table to vectorize")
+    table = np.array(d_class.step_choices, dtype=float)
+    if d_class.step_weights is None:
+        probabilities = np.full(len(table), 1 / len(table))
+    else:
+        probabilities = np.asarray(d_class.step_weights, dtype=float)
+        probabilities = probabilities / probabilities.sum()
+    return table, probabilities
+
+def step_table(d_class) -> np.ndarray:
+    """d_class.step_choices as a (k, 2) array of (dx, dy) rows."""
+    return step_distribution(d_class)[0]
+
+def final_positions(num_steps: int, num_trials: int, d_class, seed=None):
+    """End points of num_trials walks of num_steps steps, all at once.
+
+    A walk's end point only depends on how many times each step was
+    taken, and those counts are multinomial, so each trial costs one
+    draw of k counts instead of num_steps draws. Returns (x, y) arrays.
+    """
+    table, probabilities = step_distribution(d_class)
+    rng = np.random.default_rng(seed)
+    counts = rng.multinomial(num_steps, probabilities, size=num_trials)
+    ends = counts @ table
+    return ends[:, 0], ends[:, 1]
+
+def walk_trajectories(num_steps: int, num_trials: int, d_class, seed=None):
+    """Every position of num_trials walks as (x, y) arrays of shape (num_trials, num_steps + 1).
+
+    Step indices are drawn into a table in one call with an AliasSampler
+    and the positions are their cumulative sums; memory is
+    O(num_trials * num_steps).
+    """
+    table, probabilities = step_distribution(d_class)
+    rng = np.random.default_rng(seed)
+    steps = table[AliasSampler(probabilities).sample(rng, (num_trials, num_steps))]
+    positions = np.zeros((num_trials, num_steps + 1, 2))
+    np.cumsum(steps, axis=1, out=positions[:, 1:])
+    return positions[..., 0], positions[..., 1]
+
+def sim_walks_vectorized(num_steps: int, num_trials: int, d_class, seed=None):
+    """Same output as sim_walks (rounded distances from the origin) via final_positions.
+
+    Drunk classes that are not vectorizable fall back to sim_walks.
+    """
+    if not vectorizable(d_class):
+        return sim_walks(num_steps, num_trials, d_class)
+    x, y = final_positions(num_steps, num_trials, d_class, seed)
+    return np.round(np.hypot(x, y), 1).tolist()
+
+class BatchOddField:
+    """OddField for many walkers at once, with holes in lookup arrays.
+
+    Hole positions and destinations are encoded as cell numbers over the
+    (2 * x_range + 1) x (2 * y_range + 1) box. With a single layout the
+    holes live in a dense grid indexed by cell; with num_layouts > 1
+    (one independent layout per trial) they are kept as sorted
+    (layout, cell) keys and found with searchsorted, which stays
+    O(num_layouts * num_holes) in memory. As in OddField, a walker that
+    lands exactly on a hole jumps to its destination, and a later hole
+    at the same spot replaces an earlier one.
+    """
+    def __init__(self, num_holes, x_range, y_range, num_layouts=1, seed=None):
+        rng = np.random.default_rng(seed)
+        self.x_range, self.y_range = x_range, y_range
+        self.height = 2 * y_range + 1
+        self.cells = (2 * x_range + 1) * self.height
+        self.num_layouts = num_layouts
+
+        shape = (num_layouts, num_holes)
+        holes = self.cell(rng.integers(-x_range, x_range + 1, shape),
+                          rng.integers(-y_range, y_range + 1, shape))
+        dests = self.cell(rng.integers(-x_range, x_range + 1, shape),
+                          rng.integers(-y_range, y_range + 1, shape))
+        keys = (np.arange(num_layouts)[:, None] * self.cells + holes).ravel()
+        dests = dests.ravel()
+        # keep the last hole per key, like repeated dict assignment
+        keys, first = np.unique(keys[::-1], return_index=True)
+        dests = dests[::-1][first]
+
+        if num_layouts == 1:
+            self.grid = np.full(self.cells, -1, dtype=np.int64)
+            self.grid[keys] = dests
+        else:
+            self.grid = None
+            self.keys, self.dests = keys, dests
+
+    def cell(self, x, y):
+        return (x + self.x_range) * self.height + (y + self.y_range)
+
+    def wormholes(self, layout=0) -> dict:
+        """The holes of one layout as an OddField-style {(x, y): (new_x, new_y)} dict."""
+        if self.grid is not None:
+            keys = np.nonzero(self.grid >= 0)[0]
+            dests = self.grid[keys]
+        else:
+            lo, hi = np.searchsorted(self.keys, [layout * self.cells, (layout + 1) * self.cells])
+            keys, dests = self.keys[lo:hi] - layout * self.cells, self.dests[lo:hi]
+        return {self.coords(k): self.coords(d) for k, d in zip(keys.tolist(), dests.tolist())}
+
+    def coords(self, cell):
+        return cell // self.height - self.x_range, cell % self.height - self.y_range
+
+    def teleport(self, x, y, layouts=None):
+        """Move every walker in (x, y) that sits exactly on a hole; updates x and y in place."""
+        xi, yi = np.rint(x), np.rint(y)
+        on_grid = ((xi == x) & (yi == y) &
+                   (np.abs(xi) <= self.x_range) & (np.abs(yi) <= self.y_range))
+        walkers = np.nonzero(on_grid)[0]
+        if len(walkers) == 0:
+            return
+        cells = self.cell(xi[walkers].astype(np.int64), yi[walkers].astype(np.int64))
+        if self.grid is not None:
+            dests = self.grid[cells]
+        elif len(self.keys) == 0:
+            return
+        else:
+            keys = layouts[walkers] * self.cells + cells
+            pos = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+            dests = np.where(self.keys[pos] == keys, self.dests[pos], -1)
+        hit = dests >= 0
+        walkers, dests = walkers[hit], dests[hit]
+        x[walkers] = dests // self.height - self.x_range
+        y[walkers] = dests % self.height - self.y_range
+
+    def walk(self, d_class, num_steps, num_walkers, seed=None, chunk_steps=1000):
+        """Walk num_walkers drunks of d_class from the origin; returns final (x, y) arrays.
+
+        Walker i uses layout i % num_layouts. Steps are pre-drawn
+        chunk_steps at a time with an AliasSampler.
+        """
+        table, probabilities = step_distribution(d_class)
+        sampler = AliasSampler(probabilities)
+        rng = np.random.default_rng(seed)
+        x, y = np.zeros(num_walkers), np.zeros(num_walkers)
+        layouts = np.arange(num_walkers) % self.num_layouts
+        for done in range(0, num_steps, chunk_steps):
+            steps = sampler.sample(rng, (min(chunk_steps, num_steps - done), num_walkers))
+            for row in steps:
+                x += table[row, 0]
+                y += table[row, 1]
+                self.teleport(x, y, layouts)
+        return x, y
+
+def batch_final_locs(num_steps, num_trials, d_class, num_holes=1000, x_range=100,
+                     y_range=100, shared_layout=False, seed=None):
+    """Final (x, y) of num_trials OddField walks, run together.
+
+    Each trial gets its own wormhole layout, as when building a fresh
+    OddField per trial, unless shared_layout is set.
+    """
+    rng = np.random.default_rng(seed)
+    field = BatchOddField(num_holes, x_range, y_range,
+                          num_layouts=1 if shared_layout else num_trials, seed=rng)
+    return field.walk(d_class, num_steps, num_trials, seed=rng)
+
+def fast_final_locs(num_steps: int, num_trials: int, d_class, field_class=OddField):
+    """final_locs through the batched engine where it applies, as Locations.
+
+    Plain Field walks use final_positions and default OddField walks use
+    batch_final_locs (one wormhole layout per trial, as final_locs builds
+    a fresh field per trial). The Generator is seeded from the random
+    module, so random.seed still makes runs repeatable. Other fields and
+    drunks that are not vectorizable go through final_locs.
+    """
+    if not vectorizable(d_class) or field_class not in (Field, OddField):
+        return final_locs(num_steps, num_trials, d_class, field_class)
+    seed = random.getrandbits(64)
+    if field_class is Field:
+        x, y = final_positions(num_steps, num_trials, d_class, seed)
+    else:
+        x, y = batch_final_locs(num_steps, num_trials, d_class, seed=seed)
+    return [Location(float(xi), float(yi)) for xi, yi in zip(x, y)]
+
+def run_shard(d_class, num_steps: int, num_trials: int, seed_seq, simulate=None):
+    """Distances for one (drunk class, walk length, trial block) work unit.
+
+    All randomness comes from seed_seq: the vectorized engine draws from
+    a Generator built on it, and simulate (or sim_walks for drunks that
+    are not vectorizable) runs after seeding the random module from it.
+    """
+    if simulate is None and vectorizable(d_class):
+        x, y = final_positions(num_steps, num_trials, d_class, np.random.default_rng(seed_seq))
+        return np.round(np.hypot(x, y), 1)
+    random.seed(int(seed_seq.generate_state(1)[0]))
+    simulate = simulate or sim_walks
+    return np.asarray(list(simulate(num_steps, num_trials, d_class)), dtype=float)
+
+def run_sharded(drunk_kinds, walk_lengths, num_trials: int, seed: int = 0,
+                block_size: int = 25, workers: int = None, simulate=None) -> dict:
+    """Monte Carlo sweep split into (class, length, trial block) shards over a process pool.
+
+    Shards are listed in a fixed order and each gets its own child of
+    SeedSequence(seed).spawn, so the result is bit-identical for any
+    number of workers (workers=1 runs in-process). simulate, if given,
+    is a module-level sim_walks-style function(num_steps, num_trials,
+    d_class) used instead of the built-in engine. Returns
+    {(class name, num_steps): array of num_trials distances}.
+    """
+    units = [(d_class, num_steps, min(block_size, num_trials - start))
+             for d_class in drunk_kinds
+             for num_steps in walk_lengths
+             for start in range(0, num_trials, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(units))
+    args = [(d_class, num_steps, trials, seed_seq, simulate)
+            for (d_class, num_steps, trials), seed_seq in zip(units, seeds)]
+
+    if workers == 1:
+        blocks = [run_shard(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(run_shard, *zip(*args)))
+
+    results = {}
+    for (d_class, num_steps, _), block in zip(units, blocks):
+        results.setdefault((d_class.__name__, num_steps), []).append(block)
+    return {key: np.concatenate(parts) for key, parts in results.items()}
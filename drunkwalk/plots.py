@@ -0,0 +1,147 @@
+import matplotlib.pyplot as plt
+
+from .analytic import expected_distance
+from .core import Field, StyleIterator, final_locs, iter_walks, sim_walks
+from .engine import fast_final_locs, run_sharded, vectorizable
+from .stats import RunningStats
+
+# Large-print settings the walks.py and walk2.py scripts plot with
+BIG_PRINT = {
+    'lines.linewidth': 4,
+    'axes.titlesize': 20,
+    'axes.labelsize': 20,
+    'xtick.labelsize': 16,
+    'ytick.labelsize': 16,
+    'xtick.major.size': 7,
+    'ytick.major.size': 7,
+    'legend.numpoints': 1,
+}
+
+def use_big_print():
+    plt.rcParams.update(BIG_PRINT)
+
+def drunk_test(walk_lengths, num_trials: int, d_class, report: bool = False):
+    """Print mean, max and min distance per walk length.
+
+    One line per length, or with report=True the three-line
+    "random walk of" report walks.py prints.
+    """
+    for num_steps in walk_lengths:
+        stats = RunningStats()
+        for distance in iter_walks(num_steps, num_trials, d_class):
+            stats.add(distance)
+        if report:
+            print(d_class.__name__, 'random walk of', num_steps, 'steps')
+            print(' Mean =', round(stats.mean, 4))
+            print(' Max =', stats.max, 'Min =', stats.min)
+        else:
+            print(d_class.__name__, 'Walk of', num_steps, 'steps: Mean =',
+                  f'{stats.mean:.3f}, Max =',
+                  f'{stats.max}, Min = {stats.min}')
+
+def plot_drunk(walk_lengths, num_trials: int, d_class):
+    mean_distance = []
+    for num_steps in walk_lengths:
+        stats = RunningStats()
+        for distance in iter_walks(num_steps, num_trials, d_class):
+            stats.add(distance)
+        mean_distance.append(stats.mean)
+
+    plt.figure("Drunkard Walk")
+    plt.title(f"Mean Distance from Origin ({num_trials} trials)")
+    plt.ylabel('Distance from Origin')
+    plt.xlabel("Number of step")
+    plt.xscale('log')
+    plt.yscale('log')
+
+    plt.plot(walk_lengths, mean_distance, 'b--', label=d_class.__name__)
+    if vectorizable(d_class):
+        plt.plot(walk_lengths, expected_distance(d_class, walk_lengths), 'r',
+                 linewidth=1, label='expected distance')
+    plt.legend()
+    plt.show()
+
+def plot_compare(drunk_kinds, walk_lengths, num_trials: int, workers: int = None, seed: int = 0):
+    """Mean distance against walk length for each drunk class, with its expected curve.
+
+    Walks run step by step with the random module unless workers is
+    set, in which case run_sharded spreads them over that many
+    processes and the result depends only on seed.
+    """
+    style_choice = StyleIterator(('m-', 'b--', 'g-.'))
+    plt.figure(figsize=(10, 8))
+    sharded = None
+    if workers is not None:
+        sharded = run_sharded(drunk_kinds, walk_lengths, num_trials, seed=seed, workers=workers)
+
+    for d_class in drunk_kinds:
+        means = []
+        for num_steps in walk_lengths:
+            if sharded is not None:
+                trials = sharded[(d_class.__name__, num_steps)]
+            else:
+                print('Starting simulation of', d_class.__name__, num_steps, 'steps')
+                trials = sim_walks(num_steps, num_trials, d_class)
+            means.append(sum(trials) / len(trials))
+        plt.plot(walk_lengths, means, style_choice.next_style(), label=d_class.__name__)
+        if vectorizable(d_class):
+            plt.plot(walk_lengths, expected_distance(d_class, walk_lengths), 'k:',
+                     linewidth=1, label=f'{d_class.__name__} (expected)')
+
+    plt.title(f'Mean Distance from Origin ({num_trials} trials)')
+    plt.xlabel('Number of Steps')
+    plt.ylabel('Distance from Origin')
+    plt.legend(loc='best')
+    plt.grid(True)
+    plt.show()
+
+ABS_LABEL = '{name} mean abs dist = <{x:.1f}, {y:.1f}>'
+SIGNED_LABEL = '{name} mean loc. = < {x}, {y}>'
+
+def plot_locs(drunk_kinds, num_steps: int, num_trials: int, field_class=Field, limit=None,
+              signed: bool = False, label: str = None, batched: bool = False):
+    """Scatter where each drunk class ends up.
+
+    The legend gives the mean absolute offsets, or with signed=True the
+    mean location (which shows drift, e.g. ColdDrunk's southward bias),
+    also printed per class. label overrides the legend format; it is
+    filled with name, x and y. batched=True gets the end points from
+    fast_final_locs instead of walking one drunk at a time.
+    """
+    label = label or (SIGNED_LABEL if signed else ABS_LABEL)
+    style_choice = StyleIterator(('k+', 'r^', 'mo'))
+    for d_class in drunk_kinds:
+        locs = (fast_final_locs if batched else final_locs)(num_steps, num_trials,
+                                                            d_class, field_class)
+        x_vals = [loc.x for loc in locs]
+        y_vals = [loc.y for loc in locs]
+        if signed:
+            mean_x = sum(x_vals) / len(x_vals)
+            mean_y = sum(y_vals) / len(y_vals)
+            print("Class:", d_class.__name__)
+            print(f"Meanx: {mean_x} Meany: {mean_y}")
+        else:
+            mean_x = sum(abs(x) for x in x_vals) / len(x_vals)
+            mean_y = sum(abs(y) for y in y_vals) / len(y_vals)
+        plt.plot(x_vals, y_vals, style_choice.next_style(),
+                 label=label.format(name=d_class.__name__, x=mean_x, y=mean_y))
+
+    plt.title(f'Location at End of Walks ({num_steps} steps)')
+    if limit is not None:
+        plt.xlim(-limit, limit)
+        plt.ylim(-limit, limit)
+    plt.xlabel('Steps East/West of Origin')
+    plt.ylabel('Steps North/South of Origin')
+    plt.legend(loc='lower center')
+    plt.show()
+
+def plot_traces(traces, num_steps: int):
+    """Plot (label, TrajectorySampler) pairs as the spots visited on each walk."""
+    style_choice = StyleIterator(('b+', 'r^', 'ko'))
+    for label, sampler in traces:
+        plt.plot(sampler.x_vals, sampler.y_vals, style_choice.next_style(), label=label)
+    plt.title(f'Spots Visited on Walk ({num_steps} steps)')
+    plt.xlabel('Steps East/West of Origin')
+    plt.ylabel('Steps North/South of Origin')
+    plt.legend(loc='best')
+    plt.show()
@@ -0,0 +1,63 @@
+import numpy as np
+
+
+class RunningStats:
+    """Count, mean, variance, min and max in O(1) memory, plus a quantile sketch.
+
+    Mean and variance use Welford's update (and Chan's merge for whole
+    arrays in add_many). Quantiles are estimated from a uniform
+    reservoir sample of at most sketch_size values.
+    """
+    def __init__(self, sketch_size: int = 10000, seed=None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.sketch = np.empty(sketch_size)
+        self.rng = np.random.default_rng(seed)
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if self.count <= len(self.sketch):
+            self.sketch[self.count - 1] = value
+        else:
+            slot = self.rng.integers(0, self.count)
+            if slot < len(self.sketch):
+                self.sketch[slot] = value
+
+    def add_many(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        n = len(values)
+        if n == 0:
+            return
+        batch_mean = values.mean()
+        delta = batch_mean - self.mean
+        total = self.count + n
+        self.m2 += ((values - batch_mean) ** 2).sum() + delta ** 2 * self.count * n / total
+        self.mean += delta * n / total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        free = max(0, len(self.sketch) - self.count)
+        self.sketch[self.count:self.count + min(free, n)] = values[:free]
+        rest = values[free:]
+        seen = self.count + min(free, n) + np.arange(1, len(rest) + 1)
+        slots = self.rng.integers(0, seen)
+        keep = slots < len(self.sketch)
+        self.sketch[slots[keep]] = rest[keep]
+        self.count = total
+
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def std_dev(self) -> float:
+        return self.variance() ** 0.5
+
+    def quantile(self, q: float) -> float:
+        return float(np.quantile(self.sketch[:min(self.count, len(self.sketch))], q))
@@ -1,7 +1,20 @@
 import time
 import random
+import heapq
+import itertools
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
 import statistics
-from collections import deque
+import tracemalloc
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 class Node:
     def __init__(self, name):
@@ -25,35 +38,98 @@ class Edge:
         return self.src.get_name() + '->' + self.dest.get_name()
 
 
+class WeightedEdge(Edge):
+    def __init__(self, src: Node, dest: Node, weight: float = 1.0):
+        super().__init__(src, dest)
+        self.weight = weight
+    def get_weight(self):
+        return self.weight
+
+    def __str__(self):
+        return super().__str__() + f' ({self.weight})'
+
+
 class Graph:
     def __init__(self):
         self.edges = {}
+        self.parents = {}  # reverse adjacency: node -> nodes with an edge into it
+        self.weights = {}  # node -> edge weights, parallel to self.edges[node]
+        self.names = {}  # name -> Node, kept in step with self.edges
+        self.version = 0  # bumped on every mutation so caches can tell they are stale
 
     def add_node(self, node: Node):
-        if node in self.edges:
+        # Names are unique so get_node and the name index agree with edges
+        if node in self.edges or node.get_name() in self.names:
             raise ValueError("Duplicate node")
         self.edges[node] = []
+        self.parents[node] = []
+        self.weights[node] = []
+        self.names[node.get_name()] = node
+        self.version += 1
 
     def add_edge(self, edge:Edge):
         if not (edge.get_source() in self.edges and edge.get_destination() in self.edges):
             raise ValueError("Node missing in graph")
         self.edges[edge.get_source()].append(edge.get_destination())
+        self.parents[edge.get_destination()].append(edge.get_source())
+        weight = edge.get_weight() if isinstance(edge, WeightedEdge) else 1.0
+        self.weights[edge.get_source()].append(weight)
+        self.version += 1
+
+    def remove_edge(self, edge: Edge):
+        """Remove one src->dest edge (the first one added if there are several)."""
+        src, dest = edge.get_source(), edge.get_destination()
+        if src not in self.edges or dest not in self.edges[src]:
+            raise ValueError("Edge not in graph")
+        i = self.edges[src].index(dest)
+        del self.edges[src][i]
+        del self.weights[src][i]
+        self.parents[dest].remove(src)
+        self.version += 1
+
+    def remove_node(self, node: Node):
+        """Remove node together with every edge into or out of it."""
+        if node not in self.edges:
+            raise ValueError("Node missing in graph")
+        for parent in set(self.parents[node]):
+            kept = [(child, w) for child, w in zip(self.edges[parent], self.weights[parent])
+                    if child != node]
+            self.edges[parent] = [child for child, _ in kept]
+            self.weights[parent] = [w for _, w in kept]
+        for child in set(self.edges[node]):
+            self.parents[child] = [p for p in self.parents[child] if p != node]
+        del self.edges[node]
+        del self.parents[node]
+        del self.weights[node]
+        del self.names[node.get_name()]
+        self.version += 1
 
     def children_of(self, node: Node):
         return self.edges[node]
 
+    def parents_of(self, node: Node):
+        return self.parents[node]
+
+    def weights_of(self, node: Node):
+        return self.weights[node]
+
     def get_node(self, name):
-        # print("In get node")
-        for n in self.edges:
-            # print(n)
-            # print("n edges: ", self.edges[n])
-            if n.get_name() == name:
-                return n
-        raise NameError(name)
+        if name not in self.names:
+            raise NameError(name)
+        return self.names[name]
+
+    def get_nodes(self, names):
+        return [self.get_node(name) for name in names]
+
+    def has_name(self, name):
+        return name in self.names
 
     def has_node(self, node):
         return node in self.edges
 
+    def all_nodes(self):
+        return list(self.edges)
+
     def __str__(self):
         result = ''
         for src in self.edges:
@@ -61,25 +137,653 @@ class Graph:
                 result += src.get_name() + '->' + dest.get_name() + '\n'
         return result[:-1]
 
+class CompactGraph:
+    """Read-only graph stored in CSR form over dense integer node ids.
+
+    Node names are interned to ids 0..V-1 and the children of id i are
+    targets[offsets[i]:offsets[i + 1]], so an edge costs one machine int
+    (plus one double in the parallel weights array) instead of a Python
+    object. children_of, has_node and get_node behave
+    like Graph's, so the search functions run unchanged against it.
+    Build one with CompactGraphBuilder.
+
+    Node objects are created on first use (node(i)), and name_ids may be
+    any mapping with get/in/[] (load_snapshot passes a lazy one), so
+    wrapping a large graph costs next to nothing until it is queried.
+    """
+    def __init__(self, names, offsets: array, targets: array, weights: array = None,
+                 name_ids=None):
+        self.names = names
+        self.offsets = offsets
+        self.targets = targets
+        if weights is None:
+            weights = array('d', [1.0]) * len(targets)
+        self.weights = weights
+        self.nodes = [None] * len(names)  # id -> Node, filled in by node()
+        self.ids = {}  # Node -> id for every Node created so far
+        if name_ids is None:
+            name_ids = {name: i for i, name in enumerate(names)}
+        self.name_ids = name_ids
+        self.reverse = None  # (offsets, sources) CSR of incoming edges, built on demand
+        self.version = 0  # never mutated, see Graph.version
+
+    def node(self, node_id: int) -> Node:
+        node = self.nodes[node_id]
+        if node is None:
+            node = self.nodes[node_id] = Node(self.names[node_id])
+            self.ids[node] = node_id
+        return node
+
+    def num_nodes(self):
+        return len(self.nodes)
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def children_ids(self, node_id: int):
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def children_of(self, node: Node):
+        get = self.node
+        return [get(i) for i in self.children_ids(self.ids[node])]
+
+    def parent_ids(self, node_id: int):
+        if self.reverse is None:
+            sources = array('i', bytes(4 * len(self.targets)))
+            for src_id in range(len(self.offsets) - 1):
+                for i in range(self.offsets[src_id], self.offsets[src_id + 1]):
+                    sources[i] = src_id
+            offsets, sources, _ = build_csr(len(self.offsets) - 1, self.targets, sources)
+            self.reverse = offsets, sources
+        offsets, sources = self.reverse
+        return sources[offsets[node_id]:offsets[node_id + 1]]
+
+    def parents_of(self, node: Node):
+        get = self.node
+        return [get(i) for i in self.parent_ids(self.ids[node])]
+
+    def weights_of(self, node: Node):
+        node_id = self.ids[node]
+        return self.weights[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def get_node(self, name):
+        node_id = self.name_ids.get(name)
+        if node_id is None:
+            raise NameError(name)
+        return self.node(node_id)
+
+    def get_nodes(self, names):
+        return [self.get_node(name) for name in names]
+
+    def has_name(self, name):
+        return name in self.name_ids
+
+    def has_node(self, node):
+        return node in self.ids
+
+    def all_nodes(self):
+        return [self.node(i) for i in range(len(self.nodes))]
+
+    def __str__(self):
+        lines = []
+        for src_id, src_name in enumerate(self.names):
+            for dst_id in self.children_ids(src_id):
+                lines.append(src_name + '->' + self.names[dst_id])
+        return '\n'.join(lines)
+
+
+class CompactGraphBuilder:
+    """Accumulate an edge stream by name and build a CompactGraph.
+
+    Edges are kept as two flat int arrays until build() sorts them into
+    CSR order; children keep the order in which their edges were added.
+    """
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+        self.sources = array('i')
+        self.dests = array('i')
+        self.weights = array('d')
+
+    def intern(self, name) -> int:
+        node_id = self.ids.get(name)
+        if node_id is None:
+            node_id = len(self.names)
+            self.ids[name] = node_id
+            self.names.append(name)
+        return node_id
+
+    def add_node(self, name):
+        self.intern(name)
+
+    def add_edge(self, src_name, dst_name, weight: float = 1.0):
+        self.sources.append(self.intern(src_name))
+        self.dests.append(self.intern(dst_name))
+        self.weights.append(weight)
+
+    def add_edges(self, edges):
+        """edges are (src, dst) or (src, dst, weight) tuples; (name,) adds a lone node."""
+        for edge in edges:
+            if len(edge) == 1:
+                self.add_node(edge[0])
+            else:
+                self.add_edge(*edge)
+
+    def build(self) -> CompactGraph:
+        offsets, targets, weights = build_csr(len(self.names), self.sources,
+                                              self.dests, self.weights)
+        return CompactGraph(list(self.names), offsets, targets, weights)
+
+
+def build_csr(num_nodes: int, sources: array, dests: array, weights: array = None):
+    """Counting-sort parallel (source, dest) id arrays into CSR form.
+
+    Returns (offsets, targets, weights); weights is permuted alongside
+    targets when given and None otherwise. Targets of each source keep
+    their input order.
+    """
+    offsets = array('i', bytes(4 * (num_nodes + 1)))
+    for src in sources:
+        offsets[src + 1] += 1
+    for i in range(num_nodes):
+        offsets[i + 1] += offsets[i]
+
+    targets = array('i', bytes(4 * len(dests)))
+    sorted_weights = None if weights is None else array('d', bytes(8 * len(dests)))
+    fill = offsets[:-1]
+    for i, (src, dst) in enumerate(zip(sources, dests)):
+        targets[fill[src]] = dst
+        if weights is not None:
+            sorted_weights[fill[src]] = weights[i]
+        fill[src] += 1
+    return offsets, targets, sorted_weights
+
+
+class DynamicGraph(CompactGraph):
+    """A CompactGraph that accepts inserts and deletes through a delta buffer.
+
+    New edges go to per-node overflow lists and deleted base edges are
+    counted per (source, dest) pair; children_of merges these with the
+    CSR arrays on the fly. Once the buffer holds merge_threshold changes,
+    merge() folds it back into fresh CSR arrays. Removed nodes keep their
+    id as an edgeless tombstone so ids never shift. Observers (such as
+    HotSourceDistances) are told about every edge change as it happens.
+    """
+    def __init__(self, names, offsets: array, targets: array, weights: array = None,
+                 merge_threshold: int = 10000):
+        super().__init__(names, offsets, targets, weights)
+        self.merge_threshold = merge_threshold
+        self.base_nodes = len(names)
+        self.added = {}  # node id -> [(child id, weight)] not yet merged
+        self.removed = {}  # node id -> {child id: base edges to hide}
+        self.added_parents = {}  # node id -> parent ids of edges in self.added
+        self.dead = set()  # ids of removed nodes
+        self.delta_size = 0
+        self.observers = []
+
+    @classmethod
+    def from_graph(cls, graph: Graph, merge_threshold: int = 10000) -> 'DynamicGraph':
+        compact = to_compact(graph)
+        return cls(list(compact.names), array('i', compact.offsets), array('i', compact.targets),
+                   array('d', compact.weights), merge_threshold)
+
+    def live_edges(self, node_id: int):
+        """(child id, weight) pairs of node_id with the delta buffer applied."""
+        edges = []
+        if node_id < self.base_nodes:
+            hidden = dict(self.removed.get(node_id, {}))
+            for i in range(self.offsets[node_id], self.offsets[node_id + 1]):
+                child = self.targets[i]
+                if hidden.get(child):
+                    hidden[child] -= 1
+                    continue
+                edges.append((child, self.weights[i]))
+        edges.extend(self.added.get(node_id, ()))
+        return edges
+
+    def children_ids(self, node_id: int):
+        if node_id not in self.added and node_id not in self.removed:
+            if node_id >= self.base_nodes:
+                return []
+            return super().children_ids(node_id)
+        return [child for child, _ in self.live_edges(node_id)]
+
+    def weights_of(self, node: Node):
+        return [w for _, w in self.live_edges(self.ids[node])]
+
+    def num_edges(self):
+        hidden = sum(sum(counts.values()) for counts in self.removed.values())
+        return len(self.targets) - hidden + sum(len(edges) for edges in self.added.values())
+
+    def parent_ids(self, node_id: int):
+        parents = []
+        if node_id < self.base_nodes:
+            skipped = {}
+            for parent in super().parent_ids(node_id):
+                hidden = self.removed.get(parent, {}).get(node_id, 0)
+                if skipped.get(parent, 0) < hidden:
+                    skipped[parent] = skipped.get(parent, 0) + 1
+                    continue
+                parents.append(parent)
+        parents.extend(self.added_parents.get(node_id, ()))
+        return parents
+
+    def has_node(self, node):
+        return node in self.ids and self.ids[node] not in self.dead
+
+    def all_nodes(self):
+        return [self.node(i) for i in range(len(self.nodes)) if i not in self.dead]
+
+    def add_node(self, node: Node):
+        if node.get_name() in self.name_ids:
+            raise ValueError("Duplicate node")
+        node_id = len(self.nodes)
+        self.names.append(node.get_name())
+        self.nodes.append(node)
+        self.ids[node] = node_id
+        self.name_ids[node.get_name()] = node_id
+        self.version += 1
+        for observer in self.observers:
+            observer.node_added(node)
+
+    def add_edge(self, edge: Edge):
+        if not (self.has_node(edge.get_source()) and self.has_node(edge.get_destination())):
+            raise ValueError("Node missing in graph")
+        src, dest = self.ids[edge.get_source()], self.ids[edge.get_destination()]
+        weight = edge.get_weight() if isinstance(edge, WeightedEdge) else 1.0
+        self.added.setdefault(src, []).append((dest, weight))
+        self.added_parents.setdefault(dest, []).append(src)
+        self.changed()
+        for observer in self.observers:
+            observer.edge_added(edge.get_source(), edge.get_destination())
+
+    def remove_edge(self, edge: Edge):
+        """Remove one src->dest edge, the first in children_of order as Graph does."""
+        src, dest = self.ids.get(edge.get_source()), self.ids.get(edge.get_destination())
+        if src is None or dest not in self.children_ids(src):
+            raise ValueError("Edge not in graph")
+        hidden = self.removed.get(src, {}).get(dest, 0)
+        in_base = 0
+        if src < self.base_nodes:
+            in_base = list(super().children_ids(src)).count(dest)
+        if hidden < in_base:
+            self.removed.setdefault(src, {})[dest] = hidden + 1
+        else:
+            pending = self.added[src]
+            i = next(i for i, (child, _) in enumerate(pending) if child == dest)
+            del pending[i]
+            self.added_parents[dest].remove(src)
+        self.changed()
+        for observer in self.observers:
+            observer.edge_removed(edge.get_source(), edge.get_destination())
+
+    def remove_node(self, node: Node):
+        if not self.has_node(node):
+            raise ValueError("Node missing in graph")
+        node_id = self.ids[node]
+        for parent in set(self.parent_ids(node_id)):
+            while node_id in self.children_ids(parent):
+                self.remove_edge(Edge(self.node(parent), node))
+        for child in self.children_ids(node_id):
+            self.remove_edge(Edge(node, self.node(child)))
+        self.dead.add(node_id)
+        del self.name_ids[node.get_name()]
+        self.version += 1
+        for observer in self.observers:
+            observer.node_removed(node)
+
+    def changed(self):
+        self.version += 1
+        self.delta_size += 1
+        if self.delta_size >= self.merge_threshold:
+            self.merge()
+
+    def merge(self):
+        """Rebuild the CSR arrays with the delta buffer applied and empty it."""
+        sources, dests, weights = array('i'), array('i'), array('d')
+        for node_id in range(len(self.nodes)):
+            for child, weight in self.live_edges(node_id):
+                sources.append(node_id)
+                dests.append(child)
+                weights.append(weight)
+        self.offsets, self.targets, self.weights = build_csr(len(self.nodes), sources,
+                                                             dests, weights)
+        self.base_nodes = len(self.nodes)
+        self.added, self.removed, self.added_parents = {}, {}, {}
+        self.reverse = None
+        self.delta_size = 0
+
+
+class HotSourceDistances:
+    """BFS hop distances from a few hot sources, kept current under edge updates.
+
+    Register with a DynamicGraph (graph.observers.append(cache)) and each
+    inserted edge is handled by relaxing distances outward from its head,
+    touching only nodes that got closer. A deleted edge costs nothing
+    unless it was the head's last shortest-path parent; only then is that
+    source's BFS rerun. Changes made behind the cache's back (a version
+    bump it did not see) also trigger a rerun.
+    """
+    def __init__(self, graph: Graph, sources: list):
+        self.graph = graph
+        self.dist = {source: self.bfs(source) for source in sources}
+        self.stale = set()
+        self.version = graph.version
+        self.recomputed = 0
+
+    def bfs(self, source: Node) -> dict:
+        dist = {source: 0}
+        node_queue = deque([source])
+        while node_queue:
+            current = node_queue.popleft()
+            for node in self.graph.children_of(current):
+                if node not in dist:
+                    dist[node] = dist[current] + 1
+                    node_queue.append(node)
+        return dist
+
+    def edge_added(self, src: Node, dest: Node):
+        for dist in self.dist.values():
+            if src not in dist or dist[src] + 1 >= dist.get(dest, float('inf')):
+                continue
+            dist[dest] = dist[src] + 1
+            node_queue = deque([dest])
+            while node_queue:
+                current = node_queue.popleft()
+                for node in self.graph.children_of(current):
+                    if dist[current] + 1 < dist.get(node, float('inf')):
+                        dist[node] = dist[current] + 1
+                        node_queue.append(node)
+        self.version = self.graph.version
+
+    def node_added(self, node: Node):
+        self.version = self.graph.version
+
+    def node_removed(self, node: Node):
+        # Its edges were already removed one by one, so only the entry is left
+        for dist in self.dist.values():
+            dist.pop(node, None)
+        self.version = self.graph.version
+
+    def edge_removed(self, src: Node, dest: Node):
+        for source, dist in self.dist.items():
+            if source in self.stale or dest == source or src not in dist:
+                continue
+            if dist[dest] != dist[src] + 1:
+                continue  # not a shortest-path edge
+            if any(dist.get(parent) == dist[dest] - 1
+                   for parent in self.graph.parents_of(dest)):
+                continue  # dest keeps another parent at the same depth
+            self.stale.add(source)
+        self.version = self.graph.version
+
+    def distance(self, source: Node, node: Node):
+        """Hop count from a hot source to node, or None if unreachable."""
+        if self.graph.version != self.version:
+            self.stale.update(self.dist)
+            self.version = self.graph.version
+        if source in self.stale:
+            self.dist[source] = self.bfs(source)
+            self.stale.discard(source)
+            self.recomputed += 1
+        return self.dist[source].get(node)
+
+
 def make_graph(*args) -> Graph: #accept a tuple of edges in a graph and build the
+    # edges are (src, dst) or (src, dst, weight)
     return_graph = Graph()
-    nodes = {}
 
-    for src_name, dst_name in args:
-        if src_name not in nodes:
-            nodes[src_name] = Node(src_name)
-        if dst_name not in nodes:
-            nodes[dst_name] = Node(dst_name)
+    for src_name, dst_name, *weight in args:
+        if not return_graph.has_name(src_name):
+            return_graph.add_node(Node(src_name))
+        if not return_graph.has_name(dst_name):
+            return_graph.add_node(Node(dst_name))
 
-        if not return_graph.has_node(nodes[src_name]):
-            return_graph.add_node(nodes[src_name])
+        src, dst = return_graph.get_node(src_name), return_graph.get_node(dst_name)
+        if weight:
+            return_graph.add_edge(WeightedEdge(src, dst, weight[0]))
+        else:
+            return_graph.add_edge(Edge(src, dst))
 
-        if not return_graph.has_node(nodes[dst_name]):
-            return_graph.add_node(nodes[dst_name])
+    return return_graph
 
-        return_graph.add_edge(Edge(nodes[src_name], nodes[dst_name]))
+def make_compact_graph(*args) -> CompactGraph:
+    """Same input as make_graph, but builds a CompactGraph."""
+    builder = CompactGraphBuilder()
+    builder.add_edges(args)
+    return builder.build()
 
-    return return_graph
+def edge_delimiter(path: str) -> str:
+    """Field delimiter for an edge-list file: a comma for .csv, a tab otherwise."""
+    return ',' if os.path.splitext(path)[1] == '.csv' else '\t'
+
+def read_edge_chunks(path: str, delimiter: str = None, chunk_size: int = 1 << 16):
+    """Yield lists of (src, dst) or (src, dst, weight) tuples from an edge-list file.
+
+    Lines are read about chunk_size bytes at a time, so memory stays flat
+    however large the file is. The delimiter defaults to edge_delimiter's
+    pick, as save_edge_list's does; pass '' to split on any run of
+    whitespace instead. Blank lines and lines starting with '#' are
+    skipped. A line holding a single name (as save_edge_list writes for
+    isolated nodes) yields a (name,) tuple.
+    """
+    if delimiter is None:
+        delimiter = edge_delimiter(path)
+    with open(path) as f:
+        while True:
+            lines = f.readlines(chunk_size)
+            if not lines:
+                return
+            chunk = []
+            for line in lines:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                fields = [field.strip() for field in line.split(delimiter or None)]
+                if len(fields) > 2:
+                    chunk.append((fields[0], fields[1], float(fields[2])))
+                elif len(fields) == 1:
+                    chunk.append((fields[0],))
+                else:
+                    chunk.append((fields[0], fields[1]))
+            yield chunk
+
+def load_edges(source, delimiter: str = None, chunk_size: int = 1 << 16) -> CompactGraph:
+    """Stream edges into a CompactGraph.
+
+    source is a path to an edge-list file (see read_edge_chunks) or any
+    iterable of edge tuples. Names are interned as they arrive and edges
+    go straight into the builder's int arrays, so nothing is held per edge
+    beyond its CSR entry.
+    """
+    builder = CompactGraphBuilder()
+    if isinstance(source, (str, os.PathLike)):
+        for chunk in read_edge_chunks(source, delimiter, chunk_size):
+            builder.add_edges(chunk)
+    else:
+        builder.add_edges(source)
+    return builder.build()
+
+def save_edge_list(graph: Graph, path: str, delimiter: str = None):
+    """Write graph as one 'src<delimiter>dst<delimiter>weight' line per edge.
+
+    The delimiter defaults to edge_delimiter(path), the one load_edges
+    assumes. Nodes with no edges at all get a line of their own name, so
+    load_edges reads back every node.
+    """
+    if delimiter is None:
+        delimiter = edge_delimiter(path)
+    with open(path, 'w') as f:
+        for node in graph.all_nodes():
+            if not graph.children_of(node) and not graph.parents_of(node):
+                f.write(f'{node.get_name()}\n')
+            for child, weight in zip(graph.children_of(node), graph.weights_of(node)):
+                f.write(f'{node.get_name()}{delimiter}{child.get_name()}{delimiter}{weight}\n')
+
+def benchmark_loader(path: str, delimiter: str = None, chunk_size: int = 1 << 16) -> dict:
+    """Load an edge-list file and report throughput and peak traced memory.
+
+    tracemalloc slows loading several times over, so throughput is timed
+    on an untraced load and peak memory taken from a second, traced one.
+    """
+    start_time = time.perf_counter()
+    graph = load_edges(path, delimiter, chunk_size)
+    seconds = time.perf_counter() - start_time
+
+    del graph
+    tracemalloc.start()
+    graph = load_edges(path, delimiter, chunk_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'edges': graph.num_edges(),
+        'nodes': graph.num_nodes(),
+        'seconds': seconds,
+        'edges_per_sec': graph.num_edges() / seconds if seconds else 0.0,
+        'peak_bytes': peak
+    }
+
+SNAPSHOT_MAGIC = b'GRAPHCSR'
+SNAPSHOT_VERSION = 2
+SNAPSHOT_HEADER = struct.Struct('<8sIIQQQ')  # magic, version, reserved, nodes, edges, name bytes
+
+def align8(n: int) -> int:
+    return (n + 7) & ~7
+
+def save_snapshot(graph: Graph, path: str):
+    """Write graph to a versioned little-endian binary snapshot.
+
+    Layout after the 40-byte header, each section zero-padded to a
+    multiple of 8 bytes so every array starts 8-byte aligned and
+    load_snapshot can map it in place: weights float64[E], name offsets
+    uint64[V + 1], CSR offsets int32[V + 1], targets int32[E], node ids
+    sorted by encoded name int32[V], then the UTF-8 name blob.
+    (Version 1 files lack the sorted ids and padding; they still load.)
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Snapshots are little-endian only")
+    compact = to_compact(graph)
+    encoded = [name.encode() for name in compact.names]
+    name_offsets = array('Q', [0])
+    for name in encoded:
+        name_offsets.append(name_offsets[-1] + len(name))
+    name_order = array('i', sorted(range(len(encoded)), key=encoded.__getitem__))
+    blob = b''.join(encoded)
+
+    with open(path, 'wb') as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0,
+                                     compact.num_nodes(), compact.num_edges(), len(blob)))
+        for section in (array('d', compact.weights), name_offsets, array('i', compact.offsets),
+                        array('i', compact.targets), name_order):
+            data = section.tobytes()
+            f.write(data + bytes(align8(len(data)) - len(data)))
+        f.write(blob)
+
+
+class SnapshotNames:
+    """The node names of a snapshot as a read-only sequence, decoded on access."""
+    def __init__(self, blob: memoryview, name_offsets: memoryview):
+        self.blob = blob
+        self.name_offsets = name_offsets
+
+    def __len__(self):
+        return len(self.name_offsets) - 1
+
+    def raw(self, node_id: int) -> bytes:
+        return bytes(self.blob[self.name_offsets[node_id]:self.name_offsets[node_id + 1]])
+
+    def __getitem__(self, node_id: int) -> str:
+        if not -len(self) <= node_id < len(self):
+            raise IndexError(node_id)
+        return self.raw(node_id % len(self)).decode()
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class SnapshotNameIndex:
+    """name -> node id over a snapshot's sorted id table, by binary search.
+
+    Supports the get / in / [] subset of dict that CompactGraph uses,
+    decoding O(log V) names per lookup instead of building a dict.
+    """
+    def __init__(self, names: SnapshotNames, order: memoryview):
+        self.names = names
+        self.order = order
+
+    def get(self, name, default=None):
+        if not isinstance(name, str):
+            return default
+        key = name.encode()
+        lo, hi = 0, len(self.order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.names.raw(self.order[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.order) and self.names.raw(self.order[lo]) == key:
+            return self.order[lo]
+        return default
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __getitem__(self, name):
+        node_id = self.get(name)
+        if node_id is None:
+            raise KeyError(name)
+        return node_id
+
+
+def load_snapshot(path: str) -> CompactGraph:
+    """Map a save_snapshot file and wrap it in a CompactGraph.
+
+    Offsets, targets and weights are memoryviews straight into the mapped
+    file, so edges are neither parsed nor copied. Names are decoded, and
+    Node objects created, only when a query touches them, so loading
+    costs the same however large the graph is.
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, _, num_nodes, num_edges, name_bytes = SNAPSHOT_HEADER.unpack_from(mapped)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"{path} is not a graph snapshot")
+    if version not in (1, SNAPSHOT_VERSION):
+        raise ValueError(f"Unsupported snapshot version {version}")
+    padded = version >= 2
+
+    view = memoryview(mapped)
+    pos = SNAPSHOT_HEADER.size
+    def take(fmt, count, itemsize):
+        nonlocal pos
+        section = view[pos:pos + count * itemsize].cast(fmt)
+        pos += align8(count * itemsize) if padded else count * itemsize
+        return section
+    weights = take('d', num_edges, 8)
+    name_offsets = take('Q', num_nodes + 1, 8)
+    offsets = take('i', num_nodes + 1, 4)
+    targets = take('i', num_edges, 4)
+    if not padded:
+        blob = bytes(view[pos:pos + name_bytes])
+        names = [blob[name_offsets[i]:name_offsets[i + 1]].decode() for i in range(num_nodes)]
+        return CompactGraph(names, offsets, targets, weights)
+    order = take('i', num_nodes, 4)
+    names = SnapshotNames(view[pos:pos + name_bytes], name_offsets)
+    return CompactGraph(names, offsets, targets, weights, SnapshotNameIndex(names, order))
+
+def load_or_build_snapshot(path: str, build) -> CompactGraph:
+    """Load the snapshot at path, or call build() and snapshot its graph first.
+
+    build returns a graph or a (graph, nodes) pair as generate_large_graph does.
+    """
+    if not os.path.exists(path):
+        graph = build()
+        if isinstance(graph, tuple):
+            graph = graph[0]
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        save_snapshot(graph, path)
+    return load_snapshot(path)
 
 def build_graph():
     return_graph = make_graph(('Boston', 'Providence'), ('Boston', "New York"), 
@@ -89,6 +793,15 @@ def build_graph():
                ('Los Angeles', 'Boston'))
     return return_graph
 
+def build_weighted_graph():
+    # Same topology as build_graph, weighted by rough driving distance in miles
+    return_graph = make_graph(('Boston', 'Providence', 50), ('Boston', "New York", 215),
+               ('Providence', 'Boston', 50), ('Providence', 'New York', 180),
+               ('New York', 'Chicago', 790), ('Chicago', 'Denver', 1000),
+               ('Denver', 'Phoenix', 820), ('Denver', 'New York', 1780),
+               ('Los Angeles', 'Boston', 2990))
+    return return_graph
+
 def bfs_shortest_path(graph: Graph, start: Node, dest: Node):
     initial_path = [start]
     path_queue = deque([initial_path])
@@ -105,6 +818,429 @@ def bfs_shortest_path(graph: Graph, start: Node, dest: Node):
                     path_queue.append(current_path + [node])
     return current_path if found else None
 
+def bfs_parent_path(graph: Graph, start: Node, dest, stats: dict = None):
+    """BFS that records a predecessor per node instead of copying paths.
+
+    dest is a Node or a collection of Nodes; the search stops at the first
+    one discovered and the path to it is rebuilt once from the parent map.
+    Returns the same path as bfs_shortest_path for a single dest.
+    If stats is given, stats['expanded'] is incremented per node expanded.
+    """
+    targets = {dest} if isinstance(dest, Node) else set(dest)
+    if start in targets:
+        return [start]
+    parent = bfs_tree(graph, start, targets, first=True, stats=stats)
+    found = next(reversed(parent))
+    if found not in targets:
+        return None
+    return path_from_parents(parent, found)
+
+def path_from_parents(parent: dict, node: Node) -> list:
+    """Walk a predecessor map back from node to the root (whose parent is None)."""
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+def bfs_tree(graph: Graph, start: Node, targets: set = None, first: bool = False,
+             stats: dict = None) -> dict:
+    """Predecessor map of a BFS from start, stopping once every target is found.
+
+    With no targets the whole reachable tree is built. With first=True
+    the search stops at the first target discovered, which is then the
+    map's last key; bfs_parent_path is built on this, so paths read
+    from the map always match its. stats works as in bfs_parent_path.
+    """
+    remaining = set(targets) - {start} if targets is not None else None
+    parent = {start: None}
+    node_queue = deque([start])
+    while node_queue and remaining != set():
+        current = node_queue.popleft()
+        if stats is not None:
+            stats['expanded'] = stats.get('expanded', 0) + 1
+        for node in graph.children_of(current):
+            if node in parent:
+                continue
+            parent[node] = current
+            node_queue.append(node)
+            if remaining is not None and node in remaining:
+                if first:
+                    return parent
+                remaining.discard(node)
+    return parent
+
+class PathCache:
+    """LRU cache of shortest paths keyed on (start, dest) Nodes.
+
+    Entries are tied to the graph's version counter and the whole cache
+    is dropped as soon as add_node or add_edge has changed the graph.
+    Paths are stored as tuples and handed out as fresh lists, so a caller
+    editing its path cannot change what the cache returns next time.
+    """
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.graph = None
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+
+    def check(self, graph: Graph):
+        if graph is not self.graph or graph.version != self.version:
+            self.entries.clear()
+            self.graph = graph
+            self.version = graph.version
+
+    def get(self, key):
+        """Return (True, path) on a hit and (False, None) on a miss."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            path = self.entries[key]
+            return True, None if path is None else list(path)
+        self.misses += 1
+        return False, None
+
+    def put(self, key, path):
+        self.entries[key] = None if path is None else tuple(path)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries)}
+
+def shortest_paths(graph: Graph, pairs, cache: PathCache = None) -> list:
+    """Answer a batch of (start, dest) queries, one path (or None) per pair.
+
+    Pairs missing from cache are grouped by start so a single bfs_tree
+    per distinct start answers all of its destinations.
+    """
+    pairs = list(pairs)
+    results = [None] * len(pairs)
+    pending = {}  # start -> {dest: [result indexes]}
+    if cache is not None:
+        cache.check(graph)
+    for i, (start, dest) in enumerate(pairs):
+        if cache is not None:
+            hit, path = cache.get((start, dest))
+            if hit:
+                results[i] = path
+                continue
+        pending.setdefault(start, {}).setdefault(dest, []).append(i)
+
+    for start, dests in pending.items():
+        parent = bfs_tree(graph, start, dests.keys())
+        for dest, indexes in dests.items():
+            path = path_from_parents(parent, dest) if dest in parent else None
+            if cache is not None:
+                cache.put((start, dest), path)
+            for i in indexes:
+                results[i] = None if path is None else list(path)
+    return results
+
+class ReachabilityIndex:
+    """Strongly connected components and a reachability index for a graph.
+
+    Components come from an iterative Tarjan pass, numbered so that every
+    edge of the condensation DAG goes from a higher to a lower number.
+    The condensation is stored in CSR arrays, and each component gets
+    O(1) labels in fixed-width arrays, so memory and build time are
+    linear in nodes plus edges:
+
+    - height: the longest path to a sink, which must strictly drop along
+      every edge.
+    - GRAIL intervals from num_labels randomised DFS traversals: if dest's
+      post-order number is outside start's [low, post] range in any of
+      them, dest is unreachable.
+    - entry/post of the first traversal's DFS tree: a dest inside start's
+      subtree is reachable.
+
+    can_reach answers from the labels in O(num_labels) for most queries.
+    The rest fall back to a DFS over the condensation that skips every
+    component the labels rule out. The index is rebuilt automatically
+    when the graph's version changes.
+    """
+    def __init__(self, graph: Graph, num_labels: int = 5, seed: int = 0):
+        self.graph = graph
+        self.num_labels = num_labels
+        self.seed = seed
+        self.build()
+
+    def build(self):
+        self.version = self.graph.version
+        self.component = self.strongly_connected_components()
+        self.num_components = max(self.component.values(), default=-1) + 1
+        sources, dests = array('i'), array('i')
+        for node, comp in self.component.items():
+            for child in self.graph.children_of(node):
+                child_comp = self.component[child]
+                if child_comp != comp:
+                    sources.append(comp)
+                    dests.append(child_comp)
+        self.offsets, self.successors, _ = build_csr(self.num_components, sources, dests)
+
+        n = self.num_components
+        self.height = array('i', bytes(4 * n))
+        # Tarjan numbering puts every successor below its component
+        for comp in range(n):
+            for i in range(self.offsets[comp], self.offsets[comp + 1]):
+                self.height[comp] = max(self.height[comp], self.height[self.successors[i]] + 1)
+
+        has_parent = bytearray(n)
+        for succ in self.successors:
+            has_parent[succ] = 1
+        roots = [comp for comp in range(n) if not has_parent[comp]]
+        rng = random.Random(self.seed)
+        self.labels = []
+        for k in range(self.num_labels):
+            order = roots[:] if k == 0 else rng.sample(roots, len(roots))
+            self.labels.append(self.interval_labels(order, None if k == 0 else rng))
+        self.entry = self.labels[0][2]
+
+    def interval_labels(self, roots: list, rng: random.Random = None):
+        """(low, post, entry) arrays from one DFS of the condensation.
+
+        post is the post-order number, entry the counter value on first
+        visit (so a DFS-tree subtree is exactly the posts in [entry, post])
+        and low the smallest post reachable. Children are visited in CSR
+        order, or shuffled when rng is given.
+        """
+        n = self.num_components
+        low, post, entry = (array('i', bytes(4 * n)) for _ in range(3))
+        visited = bytearray(n)
+        counter = 0
+        for root in roots:
+            if visited[root]:
+                continue
+            visited[root] = 1
+            entry[root] = counter
+            work = [(root, iter(self.children(root, rng)))]
+            while work:
+                comp, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if not visited[child]:
+                        visited[child] = 1
+                        entry[child] = counter
+                        work.append((child, iter(self.children(child, rng))))
+                    continue
+                work.pop()
+                post[comp] = counter
+                counter += 1
+                smallest = post[comp]
+                for i in range(self.offsets[comp], self.offsets[comp + 1]):
+                    smallest = min(smallest, low[self.successors[i]])
+                low[comp] = smallest
+        return low, post, entry
+
+    def children(self, comp: int, rng: random.Random = None):
+        children = self.successors[self.offsets[comp]:self.offsets[comp + 1]]
+        if rng is None:
+            return children
+        children = list(children)
+        rng.shuffle(children)
+        return children
+
+    def strongly_connected_components(self) -> dict:
+        """Map each node to its component number (Tarjan, explicit stack)."""
+        index = {}
+        low = {}
+        on_stack = set()
+        scc_stack = []
+        component = {}
+        counter = 0
+        num_components = 0
+        for root in self.graph.all_nodes():
+            if root in index:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.graph.children_of(root)))]
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in index:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        scc_stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.graph.children_of(child))))
+                    elif child in on_stack:
+                        low[node] = min(low[node], index[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component[member] = num_components
+                        if member == node:
+                            break
+                    num_components += 1
+        return component
+
+    def check(self):
+        if self.graph.version != self.version:
+            self.build()
+
+    def same_component(self, a: Node, b: Node) -> bool:
+        self.check()
+        return self.component[a] == self.component[b]
+
+    def may_reach(self, a: int, b: int) -> bool:
+        """False if the labels prove component a cannot reach component b."""
+        if a == b:
+            return True
+        if a < b or self.height[a] <= self.height[b]:
+            return False
+        for low, post, _ in self.labels:
+            if not low[a] <= post[b] <= post[a]:
+                return False
+        return True
+
+    def component_reaches(self, a: int, b: int) -> bool:
+        if not self.may_reach(a, b):
+            return False
+        post = self.labels[0][1]
+        if a == b or self.entry[a] <= post[b] <= post[a]:
+            return True
+        # undecided by the labels: DFS, pruning components they rule out
+        stack, seen = [a], {a}
+        while stack:
+            comp = stack.pop()
+            for i in range(self.offsets[comp], self.offsets[comp + 1]):
+                succ = self.successors[i]
+                if succ == b:
+                    return True
+                if succ not in seen and self.may_reach(succ, b):
+                    seen.add(succ)
+                    stack.append(succ)
+        return False
+
+    def can_reach(self, start: Node, dest: Node) -> bool:
+        self.check()
+        return self.component_reaches(self.component[start], self.component[dest])
+
+    def route_components(self, a: int, b: int) -> set:
+        """Components reachable from a that can themselves reach b."""
+        self.check()
+        reaches = {b: True}
+        work = [(a, iter(self.children(a)))] if self.may_reach(a, b) and a != b else []
+        while work:
+            comp, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in reaches and self.may_reach(child, b):
+                    reaches[child] = False
+                    work.append((child, iter(self.children(child))))
+                continue
+            work.pop()
+            reaches[comp] = any(reaches.get(self.successors[i], False)
+                                for i in range(self.offsets[comp], self.offsets[comp + 1]))
+        return {comp for comp, ok in reaches.items() if ok}
+
+def reachable_bfs_path(graph: Graph, start: Node, dest: Node,
+                       index: ReachabilityIndex, stats: dict = None):
+    """bfs_parent_path that consults a ReachabilityIndex first.
+
+    Unreachable pairs return None without searching, and the BFS never
+    enqueues a node whose component cannot reach dest's, so it only
+    explores the components on some start -> dest route. Paths are the
+    same as bfs_parent_path's.
+    """
+    if not index.can_reach(start, dest):
+        return None
+    if start == dest:
+        return [start]
+    component = index.component
+    route = index.route_components(component[start], component[dest])
+
+    parent = {start: None}
+    node_queue = deque([start])
+    while node_queue:
+        current = node_queue.popleft()
+        if stats is not None:
+            stats['expanded'] = stats.get('expanded', 0) + 1
+        for node in graph.children_of(current):
+            if node in parent or component[node] not in route:
+                continue
+            parent[node] = current
+            if node == dest:
+                return path_from_parents(parent, node)
+            node_queue.append(node)
+    return None
+
+def bidirectional_bfs_path(graph: Graph, start: Node, dest: Node, stats: dict = None):
+    """Shortest path found by BFS from both ends meeting in the middle.
+
+    Searches forward over children_of from start and backward over
+    parents_of from dest, always expanding the smaller frontier one whole
+    level at a time so the first meeting level gives a shortest path.
+    stats works as in bfs_parent_path.
+    """
+    if start == dest:
+        return [start]
+
+    forward = {start: None}   # node -> predecessor towards start
+    backward = {dest: None}   # node -> successor towards dest
+    forward_dist = {start: 0}
+    backward_dist = {dest: 0}
+    forward_frontier = [start]
+    backward_frontier = [dest]
+    meet = None
+
+    while forward_frontier and backward_frontier and meet is None:
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, seen, dist, other_dist = forward_frontier, forward, forward_dist, backward_dist
+            neighbours = graph.children_of
+        else:
+            frontier, seen, dist, other_dist = backward_frontier, backward, backward_dist, forward_dist
+            neighbours = graph.parents_of
+
+        next_frontier = []
+        best = None
+        for current in frontier:
+            if stats is not None:
+                stats['expanded'] = stats.get('expanded', 0) + 1
+            for node in neighbours(current):
+                if node in seen:
+                    continue
+                seen[node] = current
+                dist[node] = dist[current] + 1
+                next_frontier.append(node)
+                if node in other_dist:
+                    total = dist[node] + other_dist[node]
+                    if best is None or total < best:
+                        best, meet = total, node
+
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    if meet is None:
+        return None
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = forward[node]
+    path.reverse()
+    node = backward[meet]
+    while node is not None:
+        path.append(node)
+        node = backward[node]
+    return path
+
 def dfs_shortest_path(graph: Graph,
                       start: Node,
                       dest: Node,
@@ -125,7 +1261,7 @@ def dfs_shortest_path(graph: Graph,
     path.add(start)
     shortest = None
 
-    for node in graph.edges[start]:
+    for node in graph.children_of(start):
         if node in path:  # Skip if would create cycle
             continue
 
@@ -142,8 +1278,258 @@ def dfs_shortest_path(graph: Graph,
     path.remove(start)
     return shortest
 
-def generate_large_graph(num_nodes: int, edge_density: float) -> Graph:
-    """Generate a larger random graph for testing."""
+def iddfs_shortest_path(graph: Graph, start: Node, dest: Node,
+                        max_depth: int = None, stats: dict = None) -> list:
+    """Iterative-deepening DFS returning a shortest path, or None.
+
+    Each round is a depth-limited DFS driven by an explicit stack, so long
+    chains do not hit the recursion limit. Within a round a node is only
+    re-entered if reached at a smaller depth than before, which also rules
+    out cycles. Gives up after max_depth edges if given, and stops early
+    once a round finds no node whose shortest distance is the depth limit.
+    stats works as in bfs_parent_path.
+    """
+    if start == dest:
+        return [start]
+
+    limit = 1
+    while max_depth is None or limit <= max_depth:
+        path = [start]
+        stack = [iter(graph.children_of(start))]
+        depth_seen = {start: 0}
+        if stats is not None:
+            stats['expanded'] = stats.get('expanded', 0) + 1
+
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                stack.pop()
+                path.pop()
+                continue
+            depth = len(path)
+            if node == dest:
+                path.append(node)
+                return path
+            if depth_seen.get(node, limit + 1) <= depth:
+                continue
+            depth_seen[node] = depth
+            if depth == limit:
+                continue
+            path.append(node)
+            stack.append(iter(graph.children_of(node)))
+            if stats is not None:
+                stats['expanded'] = stats.get('expanded', 0) + 1
+
+        # depth_seen now holds true distances up to limit; with none at the
+        # limit itself nothing lies further out, so dest is unreachable
+        if limit not in depth_seen.values():
+            return None
+        limit += 1
+    return None
+
+def path_cost(graph: Graph, path: list) -> float:
+    """Sum of edge weights along path (the cheapest edge for parallel edges)."""
+    cost = 0.0
+    for src, dst in zip(path, path[1:]):
+        cost += min(w for node, w in zip(graph.children_of(src), graph.weights_of(src))
+                    if node == dst)
+    return cost
+
+def astar_path(graph: Graph, start: Node, dest: Node,
+               heuristic=None, stats: dict = None) -> list:
+    """Cheapest path by edge weight using A* over a binary heap.
+
+    heuristic(node, dest) must never overestimate the remaining cost; with
+    no heuristic this is plain Dijkstra. Weights must be non-negative.
+    A node already expanded is reopened if a cheaper route to it turns up,
+    which only happens when the heuristic is admissible but not
+    consistent. stats works as in bfs_parent_path.
+    """
+    tie = itertools.count()  # Nodes are not orderable, so break heap ties by insertion order
+    parent = {start: None}
+    cost = {start: 0.0}
+    done = set()
+    heap = [(0.0, next(tie), start)]
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if current in done:
+            continue
+        if current == dest:
+            return path_from_parents(parent, current)
+        done.add(current)
+        if stats is not None:
+            stats['expanded'] = stats.get('expanded', 0) + 1
+
+        for node, weight in zip(graph.children_of(current), graph.weights_of(current)):
+            new_cost = cost[current] + weight
+            if new_cost >= cost.get(node, float('inf')):
+                continue
+            done.discard(node)
+            cost[node] = new_cost
+            parent[node] = current
+            estimate = new_cost + (heuristic(node, dest) if heuristic else 0.0)
+            heapq.heappush(heap, (estimate, next(tie), node))
+    return None
+
+def dijkstra_path(graph: Graph, start: Node, dest: Node, stats: dict = None) -> list:
+    return astar_path(graph, start, dest, None, stats)
+
+def hop_heuristic(graph: Graph, dest: Node, min_weight: float):
+    """Admissible A* heuristic: hop distance to dest times the lightest edge weight.
+
+    Hop distances come from one BFS over parents_of from dest. It is also
+    consistent on the nodes that can reach dest (an edge shortens the hop
+    count by at most one and weighs at least min_weight), so astar_path
+    never has to reopen a node for it.
+    """
+    hops = {dest: 0}
+    node_queue = deque([dest])
+    while node_queue:
+        current = node_queue.popleft()
+        for node in graph.parents_of(current):
+            if node not in hops:
+                hops[node] = hops[current] + 1
+                node_queue.append(node)
+    return lambda node, _dest: hops.get(node, 0) * min_weight
+
+class DistanceTable:
+    """BFS distances and predecessors from a set of source nodes, by name.
+
+    Row r of dist/pred holds the BFS tree rooted at sources[r]: dist[r, v]
+    is the hop count to node v (-1 if unreachable) and pred[r, v] the id of
+    v's parent in that tree (-1 for the root and unreachable nodes). Paths
+    from a source are read back in O(path length). save() writes the
+    arrays as .npy files so load() can memory-map them at startup.
+    """
+    def __init__(self, names: list, sources, dist, pred):
+        self.names = names
+        self.sources = sources
+        self.dist = dist
+        self.pred = pred
+        self.name_ids = {name: i for i, name in enumerate(names)}
+        self.rows = {int(node_id): r for r, node_id in enumerate(sources)}
+
+    def has_source(self, name):
+        return self.name_ids.get(name) in self.rows
+
+    def distance(self, src_name, dst_name):
+        """Hop count from src_name to dst_name, or None if unreachable."""
+        row = self.rows[self.name_ids[src_name]]
+        d = int(self.dist[row, self.name_ids[dst_name]])
+        return None if d < 0 else d
+
+    def path(self, src_name, dst_name):
+        """Names along a shortest path, or None if unreachable."""
+        row = self.rows[self.name_ids[src_name]]
+        node_id = self.name_ids[dst_name]
+        if self.dist[row, node_id] < 0:
+            return None
+        path = []
+        while node_id >= 0:
+            path.append(self.names[node_id])
+            node_id = int(self.pred[row, node_id])
+        path.reverse()
+        return path
+
+    def save(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, 'names.json'), 'w') as f:
+            json.dump(self.names, f)
+        np.save(os.path.join(directory, 'sources.npy'), np.asarray(self.sources))
+        for field in ('dist', 'pred'):
+            array_path = os.path.join(directory, field + '.npy')
+            # Tables precomputed straight into these files are already there
+            if getattr(getattr(self, field), 'filename', None) != os.path.abspath(array_path):
+                np.save(array_path, getattr(self, field))
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'DistanceTable':
+        mode = 'r' if mmap else None
+        with open(os.path.join(directory, 'names.json')) as f:
+            names = json.load(f)
+        sources = np.load(os.path.join(directory, 'sources.npy'))
+        dist = np.load(os.path.join(directory, 'dist.npy'), mmap_mode=mode)
+        pred = np.load(os.path.join(directory, 'pred.npy'), mmap_mode=mode)
+        return cls(names, sources, dist, pred)
+
+
+def precompute_distances(graph: Graph, sources: list = None,
+                         directory: str = None) -> DistanceTable:
+    """Run one BFS per source (every node by default) into a DistanceTable.
+
+    Pass a landmark subset as sources to bound the table at len(sources) * V
+    entries. With directory, the arrays are written into memory-mapped .npy
+    files there as they are filled, so the table never has to fit in RAM.
+    """
+    nodes = graph.all_nodes()
+    names = [node.get_name() for node in nodes]
+    ids = {node: i for i, node in enumerate(nodes)}
+    source_ids = np.array([ids[node] for node in (nodes if sources is None else sources)],
+                          dtype=np.int32)
+    shape = (len(source_ids), len(nodes))
+
+    if directory is None:
+        dist = np.empty(shape, dtype=np.int32)
+        pred = np.empty(shape, dtype=np.int32)
+    else:
+        os.makedirs(directory, exist_ok=True)
+        dist = np.lib.format.open_memmap(os.path.join(directory, 'dist.npy'), mode='w+',
+                                         dtype=np.int32, shape=shape)
+        pred = np.lib.format.open_memmap(os.path.join(directory, 'pred.npy'), mode='w+',
+                                         dtype=np.int32, shape=shape)
+
+    children = [[ids[child] for child in graph.children_of(node)] for node in nodes]
+    for row, src in enumerate(source_ids):
+        src = int(src)
+        row_dist = [-1] * len(nodes)
+        row_pred = [-1] * len(nodes)
+        row_dist[src] = 0
+        node_queue = deque([src])
+        while node_queue:
+            current = node_queue.popleft()
+            for child in children[current]:
+                if row_dist[child] < 0:
+                    row_dist[child] = row_dist[current] + 1
+                    row_pred[child] = current
+                    node_queue.append(child)
+        dist[row] = row_dist
+        pred[row] = row_pred
+
+    table = DistanceTable(names, source_ids, dist, pred)
+    if directory is not None:
+        dist.flush()
+        pred.flush()
+        table.save(directory)
+    return table
+
+def shortest_path(graph: Graph, start: Node, dest: Node, table: DistanceTable = None):
+    """Shortest path from the table when start is one of its sources, else by BFS."""
+    if table is not None and table.has_source(start.get_name()):
+        names = table.path(start.get_name(), dest.get_name())
+        return None if names is None else graph.get_nodes(names)
+    return bfs_parent_path(graph, start, dest)
+
+def generate_large_graph(num_nodes: int, edge_density: float, compact: bool = False,
+                         max_weight: float = None) -> Graph:
+    """Generate a larger random graph for testing.
+
+    With compact=True the edges are streamed into a CompactGraphBuilder
+    instead of allocating a Node/Edge object per hit. With max_weight,
+    edges get a uniform random weight in [1, max_weight].
+    """
+    if compact:
+        builder = CompactGraphBuilder()
+        for i in range(num_nodes):
+            builder.add_node(str(i))
+        for i in range(num_nodes):
+            for j in range(num_nodes):
+                if i != j and random.random() < edge_density:
+                    builder.sources.append(i)
+                    builder.dests.append(j)
+                    builder.weights.append(random.uniform(1, max_weight) if max_weight else 1.0)
+        g = builder.build()
+        return g, g.all_nodes()
+
     g = Graph()
     # Create nodes
     nodes = [Node(str(i)) for i in range(num_nodes)]
@@ -154,28 +1540,194 @@ def generate_large_graph(num_nodes: int, edge_density: float) -> Graph:
     for i in range(num_nodes):
         for j in range(num_nodes):
             if i != j and random.random() < edge_density:
-                g.add_edge(Edge(nodes[i], nodes[j]))
+                if max_weight:
+                    g.add_edge(WeightedEdge(nodes[i], nodes[j], random.uniform(1, max_weight)))
+                else:
+                    g.add_edge(Edge(nodes[i], nodes[j]))
     return g, nodes
 
-def benchmark_pathfinding(graph: Graph, nodes: list, num_trials: int = 100):
-    """Run multiple pathfinding trials and collect statistics."""
-    bfs_times = []
-    dfs_times = []
+def compact_from_arrays(num_nodes: int, sources, dests, weights=None) -> CompactGraph:
+    """Build a CompactGraph over nodes named '0'..str(num_nodes - 1) from NumPy id arrays.
+
+    Same layout as build_csr, but the counting sort is done with NumPy so
+    millions of edges never pass through the interpreter one by one.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    order = np.argsort(sources, kind='stable')
+    counts = np.bincount(sources, minlength=num_nodes)
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+    targets = np.asarray(dests, dtype=np.int32)[order]
+    if weights is None:
+        weights = np.ones(len(targets))
+    weights = np.asarray(weights, dtype=np.float64)[order]
+    return CompactGraph([str(i) for i in range(num_nodes)],
+                        array('i', offsets.tobytes()), array('i', targets.tobytes()),
+                        array('d', weights.tobytes()))
+
+def random_edges(num_nodes: int, edge_density: float, rng, block_size: int = 1 << 20):
+    """Erdős–Rényi edges (no self loops) as NumPy (sources, dests) arrays.
+
+    Rather than drawing one number per ordered pair, the gaps between
+    chosen pairs are drawn from a geometric distribution in blocks, so the
+    cost is proportional to the number of edges rather than V^2.
+    """
+    num_pairs = num_nodes * (num_nodes - 1)
+    if edge_density <= 0 or num_pairs == 0:
+        pairs = np.empty(0, dtype=np.int64)
+    elif edge_density >= 1:
+        pairs = np.arange(num_pairs, dtype=np.int64)
+    else:
+        blocks = []
+        last = -1
+        expected = int(num_pairs * edge_density)
+        size = min(block_size, expected + 4 * int(expected ** 0.5) + 16)
+        while last < num_pairs:
+            block = last + np.cumsum(rng.geometric(edge_density, size))
+            blocks.append(block[block < num_pairs])
+            last = int(block[-1])
+        pairs = np.concatenate(blocks)
+
+    # Pair k is source k // (V - 1) and the (k % (V - 1))-th other node
+    sources = pairs // (num_nodes - 1) if num_nodes > 1 else pairs
+    dests = pairs - sources * (num_nodes - 1)
+    dests += dests >= sources
+    return sources, dests
+
+def grid_edges(rows: int, cols: int):
+    """Edges of a rows x cols 4-neighbour grid, in both directions."""
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    right = np.stack((ids[:, :-1].ravel(), ids[:, 1:].ravel()))
+    down = np.stack((ids[:-1, :].ravel(), ids[1:, :].ravel()))
+    pairs = np.concatenate((right, down), axis=1)
+    return (np.concatenate((pairs[0], pairs[1])),
+            np.concatenate((pairs[1], pairs[0])))
+
+def scale_free_edges(num_nodes: int, attach: int, rng):
+    """Preferential-attachment (Barabási–Albert) edges, in both directions.
+
+    Each new node links to attach distinct earlier nodes chosen with
+    probability proportional to their degree, giving a power-law degree
+    distribution.
+    """
+    attach = max(1, min(attach, num_nodes - 1))
+    sources, dests = [], []
+    # Every node appears here once per edge end, so a uniform pick is degree-weighted
+    endpoints = list(range(attach))
+    for new in range(attach, num_nodes):
+        chosen = set()
+        while len(chosen) < attach:
+            picks = rng.integers(0, len(endpoints), attach - len(chosen))
+            chosen.update(endpoints[i] for i in picks)
+        for old in chosen:
+            sources.append(new)
+            dests.append(old)
+        endpoints.extend(chosen)
+        endpoints.extend([new] * attach)
+    sources, dests = np.array(sources, dtype=np.int64), np.array(dests, dtype=np.int64)
+    return np.concatenate((sources, dests)), np.concatenate((dests, sources))
+
+def generate_fast_graph(num_nodes: int, topology: str = 'random', edge_density: float = 0.01,
+                        attach: int = 3, seed: int = None, max_weight: float = None):
+    """NumPy counterpart of generate_large_graph returning (CompactGraph, nodes).
+
+    topology is 'random' (Erdős–Rényi with edge_density), 'grid' (the
+    largest rows x cols grid with rows = isqrt(num_nodes) that fits in
+    num_nodes) or 'scale_free' (preferential attachment with attach edges
+    per new node). The same seed always gives the same graph.
+    """
+    rng = np.random.default_rng(seed)
+    if topology == 'random':
+        sources, dests = random_edges(num_nodes, edge_density, rng)
+    elif topology == 'grid':
+        rows = max(1, int(num_nodes ** 0.5))
+        cols = num_nodes // rows
+        num_nodes = rows * cols
+        sources, dests = grid_edges(rows, cols)
+    elif topology == 'scale_free':
+        sources, dests = scale_free_edges(num_nodes, attach, rng)
+    else:
+        raise ValueError(f"Unknown topology: {topology}")
+
+    weights = rng.uniform(1, max_weight, len(sources)) if max_weight else None
+    g = compact_from_arrays(num_nodes, sources, dests, weights)
+    return g, g.all_nodes()
+
+def summarize(times: list) -> dict:
+    """Summary statistics with percentiles; tolerates a single sample.
+
+    Percentiles interpolate between samples (the inclusive method), so
+    they never fall outside [min, max].
+    """
+    if len(times) < 2:
+        value = times[0] if times else 0.0
+        return {'count': len(times), 'mean': value, 'median': value, 'std_dev': 0.0,
+                'min': value, 'max': value, 'p90': value, 'p95': value, 'p99': value}
+    cuts = statistics.quantiles(times, n=100, method='inclusive')
+    return {
+        'count': len(times),
+        'mean': statistics.mean(times),
+        'median': statistics.median(times),
+        'std_dev': statistics.stdev(times),
+        'min': min(times),
+        'max': max(times),
+        'p90': cuts[89],
+        'p95': cuts[94],
+        'p99': cuts[98]
+    }
+
+def run_trials(graph: Graph, nodes: list, num_trials: int = 100) -> dict:
+    """Run pathfinding trials and return the raw samples.
+
+    The result holds per-algorithm lists of timings under 'times', total
+    node expansions under 'expanded' and path costs of reachable queries
+    under 'costs'; merge_samples combines several of these and
+    summarize_samples reduces one to the benchmark_pathfinding dict.
+    Endpoints are resolved by name through graph.get_nodes, and that
+    lookup is timed separately from the searches. Dijkstra and A* are
+    compared with BFS on path cost; building A*'s hop_heuristic is not
+    included in its time.
+    """
+    times = {algo: [] for algo in ('lookup', 'bfs', 'bfs_parent', 'bidirectional',
+                                   'dfs', 'dijkstra', 'astar')}
+    stats = {algo: {'expanded': 0} for algo in ('bfs_parent', 'bidirectional',
+                                                'dfs', 'dijkstra', 'astar')}
+    costs = {'bfs': [], 'dijkstra': []}
+    min_weight = min((w for n in nodes for w in graph.weights_of(n)), default=1.0)
 
     for _ in range(num_trials):
-        # Select random start and end nodes
-        start = random.choice(nodes)
-        end = random.choice(nodes)
+        # Select random start and end names
+        names = [random.choice(nodes).get_name(), random.choice(nodes).get_name()]
+
+        start_time = time.perf_counter()
+        start, end = graph.get_nodes(names)
+        times['lookup'].append(time.perf_counter() - start_time)
 
         # Time BFS
         start_time = time.perf_counter()  # More precise than time.time()
         bfs_path = bfs_shortest_path(graph, start, end)
-        bfs_times.append(time.perf_counter() - start_time)
+        times['bfs'].append(time.perf_counter() - start_time)
+
+        # Time parent-pointer BFS
+        start_time = time.perf_counter()
+        bfs_parent = bfs_parent_path(graph, start, end, stats['bfs_parent'])
+        times['bfs_parent'].append(time.perf_counter() - start_time)
+        if bfs_parent != bfs_path:
+            raise Exception("Parent-pointer BFS disagrees with BFS")
+
+        # Time bidirectional BFS
+        start_time = time.perf_counter()
+        bidirectional = bidirectional_bfs_path(graph, start, end, stats['bidirectional'])
+        times['bidirectional'].append(time.perf_counter() - start_time)
+        if (bidirectional is None) != (bfs_path is None) or (
+                bfs_path is not None and len(bidirectional) != len(bfs_path)):
+            raise Exception("Bidirectional BFS disagrees with BFS")
 
-        # Time DFS
+        # Time DFS (iterative deepening)
         start_time = time.perf_counter()
-        dfs_path = dfs_shortest_path(graph, start, end)
-        dfs_times.append(time.perf_counter() - start_time)
+        dfs_path = iddfs_shortest_path(graph, start, end, stats=stats['dfs'])
+        times['dfs'].append(time.perf_counter() - start_time)
+        if (bfs_path is None) != (dfs_path is None):
+            raise Exception("DFS and BFS disagree on reachability")
         if (bfs_path is not None and dfs_path is not None) and len(bfs_path) != len(dfs_path):
             print([x.get_name() for x in dfs_path])
             print([x.get_name() for x in bfs_path])
@@ -187,18 +1739,243 @@ def benchmark_pathfinding(graph: Graph, nodes: list, num_trials: int = 100):
                     print(f"Incorrect path: {dfs_path[i].get_name()} -> {dfs_path[i+1].get_name()}")
             raise Exception("Code error")
 
+        # Time Dijkstra and A* on edge weights
+        start_time = time.perf_counter()
+        dijkstra = dijkstra_path(graph, start, end, stats['dijkstra'])
+        times['dijkstra'].append(time.perf_counter() - start_time)
+
+        heuristic = hop_heuristic(graph, end, min_weight)
+        start_time = time.perf_counter()
+        astar = astar_path(graph, start, end, heuristic, stats['astar'])
+        times['astar'].append(time.perf_counter() - start_time)
+        if (dijkstra is None) != (bfs_path is None) or (astar is None) != (bfs_path is None):
+            raise Exception("Weighted search disagrees with BFS on reachability")
+        if bfs_path is not None:
+            costs['bfs'].append(path_cost(graph, bfs_path))
+            costs['dijkstra'].append(path_cost(graph, dijkstra))
+            if abs(path_cost(graph, astar) - costs['dijkstra'][-1]) > 1e-9:
+                raise Exception("A* and Dijkstra disagree on path cost")
+
     return {
-        'bfs': {
-            'mean': statistics.mean(bfs_times),
-            'median': statistics.median(bfs_times),
-            'std_dev': statistics.stdev(bfs_times)
-        },
-        'dfs': {
-            'mean': statistics.mean(dfs_times),
-            'median': statistics.median(dfs_times),
-            'std_dev': statistics.stdev(dfs_times)
-        }
+        'trials': num_trials,
+        'times': times,
+        'expanded': {algo: stats[algo]['expanded'] for algo in stats},
+        'costs': costs
+    }
+
+def merge_samples(samples: list) -> dict:
+    merged = {'trials': 0, 'times': {}, 'expanded': {}, 'costs': {}}
+    for sample in samples:
+        merged['trials'] += sample['trials']
+        for key in ('times', 'costs'):
+            for algo, values in sample[key].items():
+                merged[key].setdefault(algo, []).extend(values)
+        for algo, count in sample['expanded'].items():
+            merged['expanded'][algo] = merged['expanded'].get(algo, 0) + count
+    return merged
+
+def summarize_samples(samples: dict) -> dict:
+    results = {}
+    for algo, times in samples['times'].items():
+        results[algo] = summarize(times)
+        if algo in samples['expanded']:
+            results[algo]['expanded'] = samples['expanded'][algo] / samples['trials']
+        if algo in samples['costs']:
+            costs = samples['costs'][algo]
+            results[algo]['cost'] = statistics.mean(costs) if costs else 0.0
+    return results
+
+def benchmark_pathfinding(graph: Graph, nodes: list, num_trials: int = 100):
+    """Run multiple pathfinding trials and collect statistics.
+
+    See run_trials for what is measured.
+    """
+    return summarize_samples(run_trials(graph, nodes, num_trials))
+
+def to_compact(graph: Graph) -> CompactGraph:
+    """Copy any graph into a CompactGraph, keeping node order and edge weights.
+
+    A plain CompactGraph is returned as is. A DynamicGraph is copied with
+    its delta buffer applied and removed nodes left out, since its raw
+    CSR arrays do not show either.
+    """
+    if isinstance(graph, CompactGraph) and not isinstance(graph, DynamicGraph):
+        return graph
+    builder = CompactGraphBuilder()
+    for node in graph.all_nodes():
+        builder.add_node(node.get_name())
+    for node in graph.all_nodes():
+        for child, weight in zip(graph.children_of(node), graph.weights_of(node)):
+            builder.add_edge(node.get_name(), child.get_name(), weight)
+    return builder.build()
+
+worker_graph = None  # CompactGraph rebuilt once per pool worker process
+
+def init_graph_worker(names, offsets, targets, weights):
+    global worker_graph
+    worker_graph = CompactGraph(names, offsets, targets, weights)
+
+def init_snapshot_worker(path: str):
+    """Pool initializer that maps a snapshot file, so nothing is pickled per worker."""
+    global worker_graph
+    worker_graph = load_snapshot(path)
+
+def graph_worker_args(graph: Graph) -> tuple:
+    """initargs for init_graph_worker: graph's CSR arrays in picklable form.
+
+    Snapshot-backed graphs hold memoryviews, so the arrays are copied.
+    """
+    compact = to_compact(graph)
+    return (list(compact.names), array('i', compact.offsets), array('i', compact.targets),
+            array('d', compact.weights))
+
+def run_worker_trials(seed: int, num_trials: int) -> dict:
+    random.seed(seed)
+    return run_trials(worker_graph, worker_graph.all_nodes(), num_trials)
+
+def benchmark_pathfinding_parallel(graph: Graph, num_trials: int = 100,
+                                   workers: int = None, chunk_size: int = 10):
+    """benchmark_pathfinding with trials spread over a process pool.
+
+    The graph is sent to each worker once, as the CSR arrays of a
+    CompactGraph (see graph_worker_args), when the pool starts. Trials run
+    in chunks of chunk_size with their own seeds and the raw samples are
+    merged before summarizing, so the result has the same shape as
+    benchmark_pathfinding.
+    """
+    chunks = [min(chunk_size, num_trials - i) for i in range(0, num_trials, chunk_size)]
+    seeds = [random.randrange(2**32) for _ in chunks]
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_graph_worker,
+                             initargs=graph_worker_args(graph)) as pool:
+        samples = list(pool.map(run_worker_trials, seeds, chunks))
+    return summarize_samples(merge_samples(samples))
+
+SUITE_ALGORITHMS = {
+    'bfs': bfs_parent_path,
+    'bidirectional': bidirectional_bfs_path,
+    'iddfs': lambda graph, start, dest, stats=None:
+        iddfs_shortest_path(graph, start, dest, stats=stats),
+    'dijkstra': dijkstra_path,
+}
+
+def suite_queries(graph: Graph, per_bucket: int, rng: random.Random) -> dict:
+    """Draw up to per_bucket (start, dest) name pairs for each query kind.
+
+    'self' pairs have start == dest; the rest are sorted into 'reachable'
+    and 'unreachable' with a ReachabilityIndex. Drawing stops after
+    20 * per_bucket attempts, so a bucket the graph cannot fill stays short.
+    """
+    names = [node.get_name() for node in graph.all_nodes()]
+    index = ReachabilityIndex(graph)
+    buckets = {'self': [], 'reachable': [], 'unreachable': []}
+    for name in rng.sample(names, min(per_bucket, len(names))):
+        buckets['self'].append((name, name))
+    for _ in range(20 * per_bucket):
+        if len(buckets['reachable']) >= per_bucket and len(buckets['unreachable']) >= per_bucket:
+            break
+        start, dest = rng.choice(names), rng.choice(names)
+        if start == dest:
+            continue
+        kind = 'reachable' if index.can_reach(*graph.get_nodes([start, dest])) else 'unreachable'
+        if len(buckets[kind]) < per_bucket:
+            buckets[kind].append((start, dest))
+    return buckets
+
+def benchmark_suite(graph: Graph, per_bucket: int = 50, rounds: int = 5, warmup: int = 1,
+                    seed: int = 0, algorithms: dict = None, output: str = None) -> dict:
+    """Benchmark path searches per query kind and return (and optionally save) JSON-ready results.
+
+    Queries come from a seeded generator (see suite_queries), so the same
+    seed and graph always give the same workload. Each algorithm runs
+    warmup untimed rounds, then rounds timed ones over every query; the
+    per-query times of all rounds are pooled. Nodes expanded are taken
+    from the stats counter and allocation from a separate tracemalloc
+    pass, so neither disturbs the timings. With output, the results are
+    written as sorted, indented JSON so runs can be diffed, and
+    compare_benchmarks can flag regressions between two of them.
+    """
+    algorithms = algorithms or SUITE_ALGORITHMS
+    buckets = suite_queries(graph, per_bucket, random.Random(seed))
+    results = {}
+    for algo, search in algorithms.items():
+        results[algo] = {}
+        for kind, pairs in buckets.items():
+            queries = [graph.get_nodes(pair) for pair in pairs]
+            if not queries:
+                results[algo][kind] = {'count': 0}
+                continue
+            for _ in range(warmup):
+                for start, dest in queries:
+                    search(graph, start, dest, None)
+
+            times = []
+            for _ in range(rounds):
+                for start, dest in queries:
+                    start_time = time.perf_counter()
+                    search(graph, start, dest, None)
+                    times.append(time.perf_counter() - start_time)
+
+            expanded = []
+            for start, dest in queries:
+                stats = {'expanded': 0}
+                search(graph, start, dest, stats)
+                expanded.append(stats['expanded'])
+
+            allocated = []
+            tracemalloc.start()
+            for start, dest in queries:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                search(graph, start, dest, None)
+                allocated.append(tracemalloc.get_traced_memory()[1] - before)
+            tracemalloc.stop()
+
+            results[algo][kind] = {
+                'queries': len(queries),
+                'time': summarize(times),
+                'expanded': summarize(expanded),
+                'peak_alloc_bytes': summarize(allocated)
+            }
+
+    report = {
+        'config': {'per_bucket': per_bucket, 'rounds': rounds, 'warmup': warmup, 'seed': seed,
+                   'nodes': len(graph.all_nodes()),
+                   'edges': sum(len(graph.children_of(n)) for n in graph.all_nodes()),
+                   'python': sys.version.split()[0]},
+        'results': results
     }
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    return report
+
+def compare_benchmarks(baseline: dict, current: dict, threshold: float = 0.10,
+                       min_delta: float = 1e-5) -> list:
+    """List (algorithm, bucket, old median, new median) where median time grew by more than threshold.
+
+    Growth smaller than min_delta seconds is ignored as timer noise.
+    """
+    regressions = []
+    for algo, buckets in current['results'].items():
+        for kind, result in buckets.items():
+            old = baseline['results'].get(algo, {}).get(kind, {})
+            if 'time' not in result or 'time' not in old:
+                continue
+            old_median, new_median = old['time']['median'], result['time']['median']
+            if new_median > old_median * (1 + threshold) and new_median - old_median > min_delta:
+                regressions.append((algo, kind, old_median, new_median))
+    return regressions
+
+def print_results(title: str, result: dict):
+    print(f"\n{title} Results:")
+    print(f"  Mean time:   {result['mean']*1000:.3f}ms")
+    print(f"  Median time: {result['median']*1000:.3f}ms")
+    print(f"  Std Dev:     {result['std_dev']*1000:.3f}ms")
+    print(f"  p95 / p99:   {result['p95']*1000:.3f}ms / {result['p99']*1000:.3f}ms")
+    if 'expanded' in result:
+        print(f"  Expanded:    {result['expanded']:.1f} nodes/query")
+    if 'cost' in result:
+        print(f"  Path cost:   {result['cost']:.2f} (mean over reachable queries)")
 
 
 if __name__ == '__main__':
@@ -227,17 +2004,30 @@ if __name__ == '__main__':
     # print(f"Bfs time used: {bfs_time_used}")
     # print(f"Dfs time used: {dfs_time_used}")
 
+       if len(sys.argv) > 1:
+           # python graph.py OUTPUT.json [BASELINE.json]: seeded suite, optionally diffed
+           graph, _ = generate_fast_graph(2000, edge_density=0.002, seed=0, max_weight=10)
+           report = benchmark_suite(graph, output=sys.argv[1])
+           if len(sys.argv) > 2:
+               with open(sys.argv[2]) as f:
+                   for algo, kind, old, new in compare_benchmarks(json.load(f), report):
+                       print(f"Regression: {algo} {kind} median {old*1000:.3f}ms -> {new*1000:.3f}ms")
+           sys.exit()
+
        for size in [10, 50, 100, 150, 200, 250, 300, 350, 400, 450, 500]:
         print(f"\nTesting with graph size: {size}")
-        graph, nodes = generate_large_graph(size, edge_density=0.2)
-        results = benchmark_pathfinding(graph, nodes, num_trials=100)
-
-        print(f"BFS Results:")
-        print(f"  Mean time:   {results['bfs']['mean']*1000:.3f}ms")
-        print(f"  Median time: {results['bfs']['median']*1000:.3f}ms")
-        print(f"  Std Dev:     {results['bfs']['std_dev']*1000:.3f}ms")
-
-        print(f"\nDFS Results:")
-        print(f"  Mean time:   {results['dfs']['mean']*1000:.3f}ms")
-        print(f"  Median time: {results['dfs']['median']*1000:.3f}ms")
-        print(f"  Std Dev:     {results['dfs']['std_dev']*1000:.3f}ms")
+        params = dict(topology='random', edge_density=0.2, seed=size, max_weight=10)
+        # every generator argument is in the file name, so changing one never reuses a stale graph
+        key = '_'.join(f'{k}={v}' for k, v in sorted(params.items()))
+        snapshot = os.path.join(tempfile.gettempdir(), 'graph_snapshots',
+                                f'fast_{size}_{key}_v{SNAPSHOT_VERSION}.graph')
+        graph = load_or_build_snapshot(snapshot, lambda: generate_fast_graph(size, **params))
+        results = benchmark_pathfinding_parallel(graph, num_trials=100)
+
+        print_results("Lookup", results['lookup'])
+        print_results("BFS", results['bfs'])
+        print_results("Parent-pointer BFS", results['bfs_parent'])
+        print_results("Bidirectional BFS", results['bidirectional'])
+        print_results("DFS", results['dfs'])
+        print_results("Dijkstra", results['dijkstra'])
+        print_results("A*", results['astar'])
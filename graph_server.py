@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import graph as graphs
+
+ALGORITHMS = graphs.SUITE_ALGORITHMS
+
+def run_query(graph, start: str, dest: str, algorithm: str):
+    """Resolve names, search, and return the path as a list of names (or None)."""
+    start_node, dest_node = graph.get_nodes([start, dest])
+    path = ALGORITHMS[algorithm](graph, start_node, dest_node)
+    return None if path is None else [node.get_name() for node in path]
+
+def run_worker_query(start: str, dest: str, algorithm: str):
+    return run_query(graphs.worker_graph, start, dest, algorithm)
+
+
+class LatencyHistogram:
+    """Request latencies in power-of-two microsecond buckets.
+
+    Bucket i counts requests that took less than 2**i microseconds (and at
+    least 2**(i - 1)), so memory is fixed however many requests are seen.
+    """
+    def __init__(self):
+        self.buckets = [0] * 40
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float):
+        micros = int(seconds * 1e6)
+        self.buckets[min(micros.bit_length(), len(self.buckets) - 1)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile, in seconds."""
+        if self.count == 0:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return (2 ** i) / 1e6
+        return (2 ** (len(self.buckets) - 1)) / 1e6
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'buckets_us': {f'<{2 ** i}': n for i, n in enumerate(self.buckets) if n}
+        }
+
+
+class QueryServer:
+    """Newline-delimited JSON shortest-path server over asyncio.
+
+    Each request line is an object such as
+    {"id": 1, "start": "Boston", "dest": "Phoenix", "algorithm": "bfs"}
+    and gets one response line {"id": 1, "path": [...], "latency_ms": ...}
+    (path is null when unreachable, and an "error" key replaces it on bad
+    input). {"op": "stats"} returns the latency histogram and counters.
+    Searches run in a process pool (or threads with use_processes=False)
+    so the event loop never blocks, and identical queries already in
+    flight share one search. snapshot names the file graph was loaded
+    from; pool workers then map it themselves instead of each being
+    sent a copy of the graph.
+    """
+    def __init__(self, graph, workers: int = None, use_processes: bool = True,
+                 snapshot: str = None):
+        self.graph = graph
+        if use_processes and snapshot is not None:
+            self.executor = ProcessPoolExecutor(max_workers=workers,
+                                                initializer=graphs.init_snapshot_worker,
+                                                initargs=(snapshot,))
+        elif use_processes:
+            self.executor = ProcessPoolExecutor(max_workers=workers,
+                                                initializer=graphs.init_graph_worker,
+                                                initargs=graphs.graph_worker_args(graph))
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.use_processes = use_processes
+        self.inflight = {}  # (start, dest, algorithm) -> Future of the running search
+        self.histogram = LatencyHistogram()
+        self.coalesced = 0
+        self.server = None
+        self.clients = set()  # handle_client tasks still serving a connection
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0):
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server.sockets[0].getsockname()
+
+    async def start_unix(self, path: str):
+        self.server = await asyncio.start_unix_server(self.handle_client, path)
+        return path
+
+    async def close(self):
+        """Stop listening, drop open connections and shut the pool down off the loop."""
+        if self.server is not None:
+            self.server.close()
+        for task in self.clients:
+            task.cancel()
+        await asyncio.gather(*self.clients, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    def search(self, start: str, dest: str, algorithm: str):
+        key = (start, dest, algorithm)
+        if key in self.inflight:
+            self.coalesced += 1
+            return self.inflight[key]
+        loop = asyncio.get_running_loop()
+        if self.use_processes:
+            future = loop.run_in_executor(self.executor, run_worker_query, start, dest, algorithm)
+        else:
+            future = loop.run_in_executor(self.executor, run_query, self.graph, start, dest, algorithm)
+        self.inflight[key] = future
+        future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        return future
+
+    async def handle_request(self, request: dict) -> dict:
+        response = {'id': request.get('id')}
+        if request.get('op') == 'stats':
+            response['latency'] = self.histogram.snapshot()
+            response['coalesced'] = self.coalesced
+            response['inflight'] = len(self.inflight)
+            return response
+
+        start_time = time.perf_counter()
+        algorithm = request.get('algorithm', 'bfs')
+        start, dest = request.get('start'), request.get('dest')
+        if algorithm not in ALGORITHMS:
+            response['error'] = f"Unknown algorithm: {algorithm}"
+        elif not (self.graph.has_name(start) and self.graph.has_name(dest)):
+            response['error'] = f"Unknown node: {start if not self.graph.has_name(start) else dest}"
+        else:
+            # shield so one client disconnecting does not cancel a search others share
+            response['path'] = await asyncio.shield(self.search(start, dest, algorithm))
+        latency = time.perf_counter() - start_time
+        self.histogram.record(latency)
+        response['latency_ms'] = latency * 1000
+        return response
+
+    async def respond(self, line: bytes, writer, lock: asyncio.Lock):
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            request = None
+            response = {'error': f"Bad request: {e}"}
+        if isinstance(request, dict):
+            try:
+                response = await self.handle_request(request)
+            except Exception as e:
+                response = {'id': request.get('id'), 'error': f"Query failed: {e}"}
+        elif request is not None:
+            response = {'error': "Bad request: expected a JSON object"}
+        async with lock:
+            writer.write(json.dumps(response).encode() + b'\n')
+            await writer.drain()
+
+    async def handle_client(self, reader, writer):
+        # Requests on one connection are answered as they finish, so match on "id"
+        lock = asyncio.Lock()
+        pending = set()
+        client = asyncio.current_task()
+        self.clients.add(client)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self.respond(line, writer, lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except asyncio.CancelledError:
+            # close() is dropping this connection; returning quietly keeps
+            # asyncio's connection callback from logging the cancellation
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
+            self.clients.discard(client)
+            writer.close()
+
+
+def load_graph(args):
+    if args.snapshot:
+        return graphs.load_snapshot(args.snapshot)
+    if args.edges:
+        return graphs.load_edges(args.edges)
+    return graphs.build_weighted_graph()
+
+async def serve(args):
+    server = QueryServer(load_graph(args), workers=args.workers,
+                         use_processes=not args.threads, snapshot=args.snapshot)
+    if args.unix:
+        address = await server.start_unix(args.unix)
+    else:
+        address = await server.start(args.host, args.port)
+    print(f"Serving shortest paths on {address}")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Shortest-path query server (NDJSON over TCP or a Unix socket)")
+    parser.add_argument('--snapshot', help="graph snapshot written by graph.save_snapshot")
+    parser.add_argument('--edges', help="edge-list file for graph.load_edges")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--threads', action='store_true', help="search in threads instead of processes")
+    asyncio.run(serve(parser.parse_args()))